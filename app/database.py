@@ -42,9 +42,12 @@ CREATE TABLE IF NOT EXISTS transactions (
 
 def get_db() -> sqlite3.Connection:
     if "db" not in g:
+        # uri=True lets DATABASE be a "file:" URI (e.g. a shared in-memory DB in
+        # tests); plain file paths are still opened as before.
         g.db = sqlite3.connect(
             current_app.config["DATABASE"],
             detect_types=sqlite3.PARSE_DECLTYPES,
+            uri=True,
         )
         g.db.row_factory = sqlite3.Row
     return g.db
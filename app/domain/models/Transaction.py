@@ -10,7 +10,7 @@ from ..enums import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     Domain model representing a single financial transaction.
@@ -47,6 +47,8 @@ class Transaction:
         target_balance_after:
             Balance of the target wallet immediately after the transaction is applied.
             None if the transaction failed or there is no target wallet (withdrawal).
+
+    Immutable: a recorded transaction is never edited after creation.
     """
     id: str
     type: TransactionType
@@ -4,7 +4,7 @@ from decimal import Decimal
 from ..enums import Currency, WalletStatus
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Wallet:
     '''
     Domain model representing a Wallet.
@@ -14,6 +14,8 @@ class Wallet:
     - **status**: WalletStatus, status of the wallet (ACTIVE, INACTIVE)
     - **created_at**: datetime, timestamp when the wallet was created
     - **updated_at**: datetime, timestamp when the wallet was last updated
+
+    Immutable: domain rules return a new Wallet instead of mutating one.
     '''
     id: str
     currency: Currency
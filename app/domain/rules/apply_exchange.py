@@ -6,6 +6,10 @@ from ..models.Transaction import Transaction
 from ..models.Wallet import Wallet
 from ..enums import TransactionErrorCode, TransactionStatus
 
+# SRS v2.1: credited amounts are rounded to whole cents.
+CREDIT_QUANTUM: Decimal = Decimal("0.01")
+ZERO: Decimal = Decimal("0")
+
 
 def apply_exchange(
     source_wallet: Wallet,
@@ -23,7 +27,7 @@ def apply_exchange(
 
     if error_code is None:
         # SRS v2.1: Round half up to 2 decimal places for credited amounts.
-        credited_amount = (amount * fx_rate).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        credited_amount = (amount * fx_rate).quantize(CREDIT_QUANTUM, rounding=ROUND_HALF_UP)
         source_balance_after = source_wallet.balance - amount
         target_balance_after = target_wallet.balance + credited_amount
 
@@ -89,13 +93,13 @@ def _validate_exchange(
         error_code = TransactionErrorCode.INVALID_WALLET_STATE
     elif source_wallet.id == target_wallet.id:
         error_code = TransactionErrorCode.INVALID_WALLET_STATE
-    elif amount <= Decimal("0"):
+    elif amount <= ZERO:
         error_code = TransactionErrorCode.INVALID_AMOUNT
     elif source_wallet.currency == target_wallet.currency:
         error_code = TransactionErrorCode.UNSUPPORTED_CURRENCY
     elif amount > source_wallet.balance:
         error_code = TransactionErrorCode.INSUFFICIENT_FUNDS
-    elif fx_rate is None or fx_rate <= Decimal("0"):
+    elif fx_rate is None or fx_rate <= ZERO:
         error_code = TransactionErrorCode.EXCHANGE_RATE_UNAVAILABLE
 
     return error_code
@@ -13,21 +13,23 @@ from app.domain.enums import Currency, WalletStatus
 #   python -m pytest --cov=app --cov-report=term-missing tests/unit
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_fixed_timestamp() -> datetime:
     """
     Shared fixed datetime so tests are deterministic when asserting
-    on created_at/updated_at.
+    on created_at/updated_at. Session-scoped: datetime is immutable.
 
     Value: 2025-01-01 12:00:00 (YYYY-MM-DD HH:MM:SS)
     """
     return datetime(2025, 1, 1, 12, 0, 0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wallet_factory(get_fixed_timestamp: datetime) -> Callable[..., Wallet]:
     """
     Factory fixture for creating Wallet test instances.
+    Session-scoped: the factory is stateless and returns a new Wallet per call,
+    so module-scoped fixtures can build on it too.
 
     Example usage:
         wallet = wallet_factory(
@@ -59,3 +61,18 @@ def wallet_factory(get_fixed_timestamp: datetime) -> Callable[..., Wallet]:
         )
 
     return _create
+
+
+@pytest.fixture(scope="session")
+def active_dkk_wallet(wallet_factory: Callable[..., Wallet]) -> Wallet:
+    """
+    Shared ACTIVE DKK wallet with balance 100.00.
+    Session-scoped: Wallet is frozen and domain rules return a new Wallet,
+    so tests can share one instance.
+    """
+    return wallet_factory(
+        wallet_id="wallet-active-dkk",
+        balance=Decimal("100.00"),
+        currency=Currency.DKK,
+        status=WalletStatus.ACTIVE,
+    )
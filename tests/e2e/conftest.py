@@ -1,11 +1,48 @@
 from __future__ import annotations
 
 import os
+from decimal import Decimal
+from typing import Callable, Optional
 
 import pytest
+from playwright.sync_api import Page
+
+from tests.e2e.ui_helpers import open_wallet
 
 
 @pytest.fixture(scope="session")
 def e2e_base_url() -> str:
     """Base URL for the running app under test."""
     return os.getenv("E2E_BASE_URL", "http://127.0.0.1:5000").rstrip("/")
+
+
+@pytest.fixture
+def funded_wallet(page: Page, e2e_base_url: str) -> Callable[..., str]:
+    """Factory fixture that seeds a wallet via the HTTP API and returns its id.
+
+    WHY:
+    - Arrange steps (create wallet, seed balance) are not what these journeys test.
+    - Seeding via the API skips several UI navigations per test.
+
+    Example usage:
+        wallet_id = funded_wallet("DKK", "50.00")
+    """
+
+    def _make(currency: str = "DKK", balance: Optional[str] = None, *, open_page: bool = True) -> str:
+        create_resp = page.request.post(f"{e2e_base_url}/api/wallets", data={"currency": currency})
+        assert create_resp.status == 201, create_resp.text()
+        wallet_id = create_resp.json()["id"]
+
+        # Numeric check: "0", "0.00" etc. mean "no deposit" (the API rejects zero amounts).
+        if balance is not None and Decimal(balance) != 0:
+            deposit_resp = page.request.post(
+                f"{e2e_base_url}/api/wallets/{wallet_id}/deposit",
+                data={"amount": balance, "currency": currency},
+            )
+            assert deposit_resp.status == 200, deposit_resp.text()
+
+        if open_page:
+            open_wallet(page, e2e_base_url, wallet_id)
+        return wallet_id
+
+    return _make
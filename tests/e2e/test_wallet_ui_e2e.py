@@ -5,7 +5,6 @@ from playwright.sync_api import Page, expect
 
 from tests.e2e.ui_helpers import (
     create_wallet_via_ui,
-    open_wallet,
     wallet_balance_locator,
     wallet_status_locator,
 )
@@ -24,10 +23,9 @@ def test_create_wallet_dkk_shows_active_and_zero(page: Page, e2e_base_url: str):
 
 
 @pytest.mark.e2e
-def test_deposit_updates_balance_and_shows_deposit_transaction(page: Page, e2e_base_url: str):
+def test_deposit_updates_balance_and_shows_deposit_transaction(page: Page, funded_wallet):
     # Arrange
-    wallet_id = create_wallet_via_ui(page, e2e_base_url, "DKK")
-    open_wallet(page, e2e_base_url, wallet_id)
+    funded_wallet("DKK")
 
     # Act
     deposit_form = page.locator("#depositForm")
@@ -44,15 +42,9 @@ def test_deposit_updates_balance_and_shows_deposit_transaction(page: Page, e2e_b
 
 
 @pytest.mark.e2e
-def test_withdraw_insufficient_funds_shows_error_balance_unchanged_and_failed_tx(page: Page, e2e_base_url: str):
-    # Arrange
-    wallet_id = create_wallet_via_ui(page, e2e_base_url, "DKK")
-    open_wallet(page, e2e_base_url, wallet_id)
-
-    # Arrange (seed balance via UI)
-    deposit_form = page.locator("#depositForm")
-    deposit_form.get_by_label("Amount").fill("50.00")
-    deposit_form.get_by_role("button", name="Deposit").click()
+def test_withdraw_insufficient_funds_shows_error_balance_unchanged_and_failed_tx(page: Page, funded_wallet):
+    # Arrange (seed balance via API)
+    funded_wallet("DKK", "50.00")
     expect(wallet_balance_locator(page)).to_have_text("50.00")
 
     # Act
@@ -70,17 +62,12 @@ def test_withdraw_insufficient_funds_shows_error_balance_unchanged_and_failed_tx
 
 
 @pytest.mark.e2e
-def test_exchange_dkk_to_usd_updates_balances_and_shows_exchange_tx(page: Page, e2e_base_url: str):
-    # Arrange
-    dkk_wallet_id = create_wallet_via_ui(page, e2e_base_url, "DKK")
-    usd_wallet_id = create_wallet_via_ui(page, e2e_base_url, "USD")
-
-    # Arrange (fund DKK wallet via UI)
-    open_wallet(page, e2e_base_url, dkk_wallet_id)
-    deposit_form = page.locator("#depositForm")
-    deposit_form.get_by_label("Amount").fill("20.00")
-    deposit_form.get_by_role("button", name="Deposit").click()
-    expect(wallet_balance_locator(page)).to_have_text("20.00")
+def test_exchange_dkk_to_usd_updates_balances_and_shows_exchange_tx(
+    page: Page, e2e_base_url: str, funded_wallet
+):
+    # Arrange (fund DKK wallet via API)
+    dkk_wallet_id = funded_wallet("DKK", "20.00", open_page=False)
+    usd_wallet_id = funded_wallet("USD", open_page=False)
 
     # Act
     page.goto(f"{e2e_base_url}/exchange.html")
@@ -103,10 +90,9 @@ def test_exchange_dkk_to_usd_updates_balances_and_shows_exchange_tx(page: Page,
 
 
 @pytest.mark.e2e
-def test_freeze_blocks_deposit_and_unfreeze_allows_deposit_again(page: Page, e2e_base_url: str):
+def test_freeze_blocks_deposit_and_unfreeze_allows_deposit_again(page: Page, funded_wallet):
     # Arrange
-    wallet_id = create_wallet_via_ui(page, e2e_base_url, "DKK")
-    open_wallet(page, e2e_base_url, wallet_id)
+    funded_wallet("DKK")
 
     # Act
     page.locator("[data-testid='freeze-btn']").click()
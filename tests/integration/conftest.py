@@ -1,37 +1,82 @@
 from __future__ import annotations
 
+import os
+import sqlite3
 from decimal import Decimal
-from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
+from flask import Flask, g
 
 from app import create_app
+from app.database import init_schema
 from app.domain.exceptions import ExchangeRateServiceError
+from tests.integration.helpers import create_wallet
 
 
-@pytest.fixture
-def app_instance(tmp_path: Path):
-    """Create a fresh Flask app + SQLite DB per test.
+class _RollbackConnection(sqlite3.Connection):
+    """SQLite connection whose commit() is a no-op.
+
+    Repositories commit after every write. Under test, those commits are swallowed
+    so everything a test writes stays inside one SAVEPOINT that is rolled back on
+    teardown.
+    """
+
+    def commit(self) -> None:
+        pass
+
+
+# Durability is irrelevant under test: skip fsync and keep journals/temp data in RAM.
+# (Mostly a no-op for the in-memory DB, but keeps any file-backed path fast too.)
+_FAST_TEST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+@pytest.fixture(scope="session")
+def integration_db_uri():
+    """Session-wide shared-cache in-memory SQLite DB.
+
+    A shared-cache in-memory DB only lives while a connection to it is open, so a
+    keeper connection is held for the whole session.
+
+    Under pytest-xdist (`pytest -n auto`), each worker is its own process with its
+    own session, so every worker gets a private DB (and its own app).
+    Nothing is shared across workers.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_uri = f"file:test_wallet_{worker}_{uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
+    yield db_uri
+    keeper.close()
+
+
+@pytest.fixture(scope="session")
+def app_instance(integration_db_uri: str) -> Flask:
+    """Flask app built once per session, backed by the in-memory test DB.
 
     WHY:
-    - Isolation: each test gets its own DB file.
-    - Stability: schema is initialized eagerly so tests don't depend on request order.
+    - Speed: the app is built once per session, and the DB never touches disk.
+    - Isolation: handled by `app_context`, which rolls back each test's writes.
+    - Stability: schema is initialized eagerly (once per app) so tests don't depend
+      on request order.
     """
-    db_path = tmp_path / "test_wallet.db"
     app = create_app(
         {
             "TESTING": True,
-            "DATABASE": str(db_path),
+            "DATABASE": integration_db_uri,
         }
     )
 
     # Defensive: ensure schema exists even if app init changes later.
+    # Runs once per session, so no DDL happens between tests.
     with app.app_context():
-        from app.database import init_schema
-
         init_schema()
 
-    yield app
+    return app
 
 
 @pytest.fixture
@@ -39,13 +84,76 @@ def client(app_instance):
     return app_instance.test_client()
 
 
-@pytest.fixture
-def fx_rate_stub(monkeypatch):
-    """Deterministic FX stub.
+@pytest.fixture(scope="session")
+def repo() -> SimpleNamespace:
+    """Repository read functions for DB assertions.
+
+    Imported here rather than at test-module import time, so collection
+    (e.g. `pytest --collect-only` or `-k` selection) does not load the
+    repository layer.
+    """
+    from app.repository.transactions_repo import get_transactions_for_wallet
+    from app.repository.wallets_repo import get_wallet
+
+    return SimpleNamespace(
+        get_wallet=get_wallet,
+        get_transactions_for_wallet=get_transactions_for_wallet,
+    )
+
+
+@pytest.fixture(scope="session")
+def seed_dkk_wallet_id(app_instance) -> str:
+    """DKK wallet created once per session, for tests that only need a routable id.
+
+    Created outside any test's SAVEPOINT, so it is really committed and survives
+    per-test rollbacks. Only use it in tests that never mutate the wallet.
+    """
+    return create_wallet(app_instance.test_client(), "DKK")
+
+
+@pytest.fixture(scope="session")
+def seed_usd_wallet_id(app_instance) -> str:
+    """USD counterpart of `seed_dkk_wallet_id` (e.g. an exchange target)."""
+    return create_wallet(app_instance.test_client(), "USD")
+
+
+@pytest.fixture(autouse=True)
+def app_context(app_instance):
+    """Keep one app context pushed for the whole test, inside a rolled-back SAVEPOINT.
+
+    WHY:
+    - DB assertions (repository reads) need an app context.
+    - Pushing it once per test replaces repeated `with app.app_context():` blocks;
+      test client requests reuse the pushed context (and so its DB connection).
+    - Isolation: the test's writes are rolled back instead of rebuilding the DB.
+    """
+    with app_instance.app_context():
+        db = sqlite3.connect(
+            app_instance.config["DATABASE"],
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            uri=True,
+            factory=_RollbackConnection,
+        )
+        db.row_factory = sqlite3.Row
+        for pragma in _FAST_TEST_PRAGMAS:
+            db.execute(pragma)
+        g.db = db  # picked up by app.database.get_db(); closed on context teardown
+
+        db.execute("SAVEPOINT test_case")
+        yield
+        db.execute("ROLLBACK TO test_case")
+        db.execute("RELEASE test_case")
+
+
+@pytest.fixture(scope="session")
+def fx_rate_stub():
+    """Deterministic FX stub, installed once for the session.
 
     WHY:
     - Integration tests should not hit the network.
     - Patch target is wallet_service's imported symbol.
+    - The stub is stateless, so one patch can serve every exchange test
+      (`monkeypatch` is function-scoped, hence `MonkeyPatch.context()`).
     """
     def _stubbed_get_exchange_rate(source_currency, target_currency, explicit_rate=None):
         # Match the real signature: get_exchange_rate(source, target, explicit_rate=None)
@@ -53,15 +161,21 @@ def fx_rate_stub(monkeypatch):
             return explicit_rate
         return Decimal("2.00")
 
-    monkeypatch.setattr(
-        "app.services.wallet_service.get_exchange_rate",
-        _stubbed_get_exchange_rate,
-    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.services.wallet_service.get_exchange_rate",
+            _stubbed_get_exchange_rate,
+        )
+        yield
 
 
 @pytest.fixture
 def fx_rate_fail_stub(monkeypatch):
-    """FX stub that simulates an upstream outage (useful for 502 assertions)."""
+    """FX stub that simulates an upstream outage (useful for 502 assertions).
+
+    Stays function-scoped: it is layered over (and undone back to) whatever FX
+    function is active, so the outage never leaks into other tests.
+    """
 
     def _fail(source_currency, target_currency, explicit_rate=None):
         raise ExchangeRateServiceError("FX service down")
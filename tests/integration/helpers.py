@@ -33,3 +33,30 @@ def exchange(client, source_wallet_id: str, target_wallet_id: str, amount: str):
             "amount": amount,
         },
     )
+
+
+def fetch_snapshot(repo, source_wallet_id: str, target_wallet_id: str):
+    """Read persisted state for an exchange pair in two queries.
+
+    Returns (source_wallet, target_wallet, source_transactions): both wallets come
+    from a single `IN (...)` lookup, plus one query for the source's transactions.
+    Must run inside an app context.
+    """
+    # Imported here (like the `repo` fixture) so collection doesn't load the DB layer.
+    from app.database import get_db
+    from app.repository.wallets_repo import _row_to_wallet
+
+    rows = get_db().execute(
+        """
+        SELECT id, currency, balance, status, created_at, updated_at
+        FROM wallets
+        WHERE id IN (?, ?)
+        """,
+        (source_wallet_id, target_wallet_id),
+    ).fetchall()
+    wallets = {row["id"]: _row_to_wallet(row) for row in rows}
+    assert source_wallet_id in wallets, f"source wallet {source_wallet_id} not persisted"
+    assert target_wallet_id in wallets, f"target wallet {target_wallet_id} not persisted"
+
+    source_transactions = repo.get_transactions_for_wallet(source_wallet_id)
+    return wallets[source_wallet_id], wallets[target_wallet_id], source_transactions
@@ -2,7 +2,8 @@ from __future__ import annotations
 """Integration tests for the Flask API (vertical slice).
 
 These tests exercise the HTTP layer (Flask test client) and verify persistence via the
-repository layer against a real SQLite database created per test by integration fixtures.
+repository layer against a real SQLite database: one shared-cache in-memory DB per test
+session (per xdist worker), with each test's writes rolled back to a SAVEPOINT on teardown.
 The external FX boundary is stubbed (e.g., `fx_rate_stub`) so exchange tests are deterministic.
 
 Scope / intent
@@ -19,7 +20,8 @@ Each test may use short phase comments:
 - Arrange: scenario preconditions
 - Act: the API call under test
 - Assert (API): HTTP status + JSON contract/fields/codes
-- Assert (DB): persisted state within `with app_instance.app_context():`
+- Assert (DB): persisted state via the `repo` fixture (an app context is auto-pushed
+  per test by conftest)
 Unused phases are omitted.
 
 Run:
@@ -31,25 +33,34 @@ from decimal import Decimal
 import pytest
 
 from app.domain.enums import Currency, TransactionStatus, TransactionType
-from app.repository.transactions_repo import get_transactions_for_wallet
-from app.repository.wallets_repo import get_wallet
-from tests.integration.helpers import create_wallet, deposit, exchange, withdraw
+from tests.integration.helpers import (
+    create_wallet,
+    deposit,
+    exchange,
+    fetch_snapshot,
+    withdraw,
+)
+
+# Shared Decimal values for DB assertions (parsed once at import).
+ZERO = Decimal("0.00")
+TEN = Decimal("10.00")
+TWENTY = Decimal("20.00")
+NINETY = Decimal("90.00")
 
 
 # --- Wallet endpoints ---
 
 
 @pytest.mark.integration
-def test_create_wallet_persists_row(client, app_instance):
+def test_create_wallet_persists_row(client, repo):
     # Act: create wallet via API
     wallet_id = create_wallet(client, "DKK")
 
     # Assert (DB): wallet row persisted
-    with app_instance.app_context():
-        wallet = get_wallet(wallet_id)
-        assert wallet.id == wallet_id
-        assert wallet.currency.value == "DKK"
-        assert wallet.balance == Decimal("0.00")
+    wallet = repo.get_wallet(wallet_id)
+    assert wallet.id == wallet_id
+    assert wallet.currency.value == "DKK"
+    assert wallet.balance == ZERO
 
 
 @pytest.mark.integration
@@ -70,9 +81,7 @@ def test_list_wallets_includes_created_wallet(client):
 
 
 @pytest.mark.integration
-def test_freeze_wallet_persists_status_and_records_status_change_transaction(
-    client, app_instance
-):
+def test_freeze_wallet_persists_status_and_records_status_change_transaction(client, repo):
     # Arrange: create wallet
     wallet_id = create_wallet(client, "DKK")
 
@@ -89,13 +98,12 @@ def test_freeze_wallet_persists_status_and_records_status_change_transaction(
     assert body["transaction"]["status"] == TransactionStatus.COMPLETED.value
 
     # Assert (DB)
-    with app_instance.app_context():
-        persisted_wallet = get_wallet(wallet_id)
-        assert persisted_wallet.status.value == "FROZEN"
+    persisted_wallet = repo.get_wallet(wallet_id)
+    assert persisted_wallet.status.value == "FROZEN"
 
-        transactions = get_transactions_for_wallet(wallet_id)
-        assert len(transactions) == 1
-        assert transactions[0].type == TransactionType.STATUS_CHANGE
+    transactions = repo.get_transactions_for_wallet(wallet_id)
+    assert len(transactions) == 1
+    assert transactions[0].type == TransactionType.STATUS_CHANGE
 
 
 
@@ -103,7 +111,7 @@ def test_freeze_wallet_persists_status_and_records_status_change_transaction(
 
 
 @pytest.mark.integration
-def test_deposit_success_persists_wallet_and_transaction(client, app_instance):
+def test_deposit_success_persists_wallet_and_transaction(client, repo):
     # Arrange: create wallet
     wallet_id = create_wallet(client, "DKK")
 
@@ -122,17 +130,16 @@ def test_deposit_success_persists_wallet_and_transaction(client, app_instance):
     assert body["transaction"]["error_code"] is None
 
     # Assert (DB): wallet updated + tx persisted
-    with app_instance.app_context():
-        persisted_wallet = get_wallet(wallet_id)
-        assert persisted_wallet.balance == Decimal("10.00")
+    persisted_wallet = repo.get_wallet(wallet_id)
+    assert persisted_wallet.balance == TEN
 
-        transactions = get_transactions_for_wallet(wallet_id)
-        assert len(transactions) == 1
-        assert transactions[0].status == TransactionStatus.COMPLETED
+    transactions = repo.get_transactions_for_wallet(wallet_id)
+    assert len(transactions) == 1
+    assert transactions[0].status == TransactionStatus.COMPLETED
 
 
 @pytest.mark.integration
-def test_withdraw_insufficient_funds_records_failed_transaction(client, app_instance):
+def test_withdraw_insufficient_funds_records_failed_transaction(client, repo):
     # Arrange: create wallet with zero balance
     wallet_id = create_wallet(client, "DKK")
 
@@ -148,14 +155,13 @@ def test_withdraw_insufficient_funds_records_failed_transaction(client, app_inst
     assert body["transaction"]["error_code"] == "INSUFFICIENT_FUNDS"
 
     # Assert (DB): balance unchanged + failed tx persisted
-    with app_instance.app_context():
-        persisted_wallet = get_wallet(wallet_id)
-        assert persisted_wallet.balance == Decimal("0.00")
+    persisted_wallet = repo.get_wallet(wallet_id)
+    assert persisted_wallet.balance == ZERO
 
-        transactions = get_transactions_for_wallet(wallet_id)
-        assert len(transactions) == 1
-        assert transactions[0].status == TransactionStatus.FAILED
-        assert transactions[0].error_code.value == "INSUFFICIENT_FUNDS"
+    transactions = repo.get_transactions_for_wallet(wallet_id)
+    assert len(transactions) == 1
+    assert transactions[0].status == TransactionStatus.FAILED
+    assert transactions[0].error_code.value == "INSUFFICIENT_FUNDS"
 
 
 @pytest.mark.integration
@@ -166,10 +172,10 @@ def test_withdraw_insufficient_funds_records_failed_transaction(client, app_inst
         ("withdraw", {"amount": "abc", "currency": "DKK"}),
     ],
 )
-def test_deposit_withdraw_invalid_amount_returns_400_json(client, endpoint, payload):
-    wallet_id = create_wallet(client, "DKK")
-
-    response = client.post(f"/api/wallets/{wallet_id}/{endpoint}", json=payload)
+def test_deposit_withdraw_invalid_amount_returns_400_json(
+    client, seed_dkk_wallet_id, endpoint, payload
+):
+    response = client.post(f"/api/wallets/{seed_dkk_wallet_id}/{endpoint}", json=payload)
 
     assert response.status_code == 400
     body = response.get_json()
@@ -179,11 +185,10 @@ def test_deposit_withdraw_invalid_amount_returns_400_json(client, endpoint, payl
 
 
 @pytest.mark.integration
-def test_exchange_invalid_amount_returns_400_json(client):
-    source_wallet_id = create_wallet(client, "DKK")
-    target_wallet_id = create_wallet(client, "USD")
-
-    response = exchange(client, source_wallet_id, target_wallet_id, "abc")
+def test_exchange_invalid_amount_returns_400_json(
+    client, seed_dkk_wallet_id, seed_usd_wallet_id
+):
+    response = exchange(client, seed_dkk_wallet_id, seed_usd_wallet_id, "abc")
 
     assert response.status_code == 400
     body = response.get_json()
@@ -196,8 +201,9 @@ def test_exchange_invalid_amount_returns_400_json(client):
 
 
 @pytest.mark.integration
-def test_exchange_success_updates_both_wallets(client, app_instance, fx_rate_stub):
-    """Verify end-to-end exchange wiring updates balances and records an exchange tx."""
+def test_exchange_success_updates_both_wallets(client, repo, fx_rate_stub):
+    """Verify end-to-end exchange wiring updates balances and records an exchange tx
+    with the core accounting fields persisted."""
 
     # Arrange: create wallets + seed source balance
     source_wallet_id = create_wallet(client, "DKK")
@@ -214,69 +220,41 @@ def test_exchange_success_updates_both_wallets(client, app_instance, fx_rate_stu
     assert isinstance(body, dict)
 
     assert body["source_wallet"]["balance"] == "90.00"
-    assert Decimal(body["target_wallet"]["balance"]) == Decimal("20.00")
+    assert Decimal(body["target_wallet"]["balance"]) == TWENTY
     assert body["transaction"]["type"] == TransactionType.EXCHANGE.value
     assert body["transaction"]["status"] == TransactionStatus.COMPLETED.value
 
     # Assert (DB): both wallets updated + exchange tx persisted
-    with app_instance.app_context():
-        persisted_source = get_wallet(source_wallet_id)
-        persisted_target = get_wallet(target_wallet_id)
-        assert persisted_source.balance == Decimal("90.00")
-        assert persisted_target.balance == Decimal("20.00")
-
-        source_transactions = get_transactions_for_wallet(source_wallet_id)
-        assert len(source_transactions) == 2  # deposit + exchange
-
-        exchange_transactions = [
-            tx for tx in source_transactions if tx.type == TransactionType.EXCHANGE
-        ]
-        assert len(exchange_transactions) == 1
-
-
-@pytest.mark.integration
-def test_exchange_success_persists_expected_transaction_fields(
-    client, app_instance, fx_rate_stub
-):
-    """Verify persisted exchange tx contains core accounting fields."""
-
-    # Arrange: create wallets + seed source balance
-    source_wallet_id = create_wallet(client, "DKK")
-    target_wallet_id = create_wallet(client, "USD")
-
-    deposit(client, source_wallet_id, "100.00", "DKK")
-
-    # Act: exchange via API
-    response = exchange(client, source_wallet_id, target_wallet_id, "10.00")
-
-    # Assert (API): 200
-    assert response.status_code == 200
-
-    # Assert (DB): exchange tx fields persisted
-    with app_instance.app_context():
-        source_transactions = get_transactions_for_wallet(source_wallet_id)
-        assert len(source_transactions) == 2  # deposit + exchange
-        exchange_transactions = [
-            tx for tx in source_transactions if tx.type == TransactionType.EXCHANGE
-        ]
-        assert len(exchange_transactions) == 1
-
-        exchange_tx = exchange_transactions[0]
-        assert exchange_tx.status == TransactionStatus.COMPLETED
-        assert exchange_tx.error_code is None
-        assert exchange_tx.source_wallet_id == source_wallet_id
-        assert exchange_tx.target_wallet_id == target_wallet_id
-        assert exchange_tx.amount == Decimal("10.00")
-        assert exchange_tx.currency == Currency.DKK
-        assert exchange_tx.credited_amount == Decimal("20.00")
-        assert exchange_tx.credited_currency == Currency.USD
-        assert exchange_tx.source_balance_after == Decimal("90.00")
-        assert exchange_tx.target_balance_after == Decimal("20.00")
+    persisted_source, persisted_target, source_transactions = fetch_snapshot(
+        repo, source_wallet_id, target_wallet_id
+    )
+    assert persisted_source.balance == NINETY
+    assert persisted_target.balance == TWENTY
+
+    assert len(source_transactions) == 2  # deposit + exchange
+
+    exchange_transactions = [
+        tx for tx in source_transactions if tx.type == TransactionType.EXCHANGE
+    ]
+    assert len(exchange_transactions) == 1
+
+    # Assert (DB): persisted accounting fields
+    exchange_tx = exchange_transactions[0]
+    assert exchange_tx.status == TransactionStatus.COMPLETED
+    assert exchange_tx.error_code is None
+    assert exchange_tx.source_wallet_id == source_wallet_id
+    assert exchange_tx.target_wallet_id == target_wallet_id
+    assert exchange_tx.amount == TEN
+    assert exchange_tx.currency == Currency.DKK
+    assert exchange_tx.credited_amount == TWENTY
+    assert exchange_tx.credited_currency == Currency.USD
+    assert exchange_tx.source_balance_after == NINETY
+    assert exchange_tx.target_balance_after == TWENTY
 
 
 @pytest.mark.integration
 def test_exchange_fx_failure_returns_502_and_does_not_change_wallets(
-    client, app_instance, fx_rate_fail_stub
+    client, repo, fx_rate_fail_stub
 ):
     """External FX failure returns 502 and must not mutate balances."""
 
@@ -296,22 +274,21 @@ def test_exchange_fx_failure_returns_502_and_does_not_change_wallets(
     assert "error" in body
 
     # Assert (DB): balances unchanged + no exchange tx
-    with app_instance.app_context():
-        persisted_source = get_wallet(source_wallet_id)
-        persisted_target = get_wallet(target_wallet_id)
-        assert persisted_source.balance == Decimal("10.00")
-        assert persisted_target.balance == Decimal("0.00")
+    persisted_source, persisted_target, source_transactions = fetch_snapshot(
+        repo, source_wallet_id, target_wallet_id
+    )
+    assert persisted_source.balance == TEN
+    assert persisted_target.balance == ZERO
 
-        # Current behavior: exchange fails before apply_exchange(), so only deposit tx exists
-        source_transactions = get_transactions_for_wallet(source_wallet_id)
-        assert len(source_transactions) == 1
+    # Current behavior: exchange fails before apply_exchange(), so only deposit tx exists
+    assert len(source_transactions) == 1
 
 
 # --- Transactions ---
 
 
 @pytest.mark.integration
-def test_list_transactions_returns_expected_items(client, app_instance):
+def test_list_transactions_returns_expected_items(client):
     # Arrange: create wallet + create transactions
     wallet_id = create_wallet(client, "DKK")
 
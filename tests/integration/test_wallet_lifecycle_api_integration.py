@@ -11,32 +11,25 @@ This test exercises the internal HTTP API (Flask test client):
 routes -> service -> domain rules -> repositories -> SQLite.
 """
 
-from pathlib import Path
-
 import pytest
 
-from app import create_app
 from tests.integration.helpers import create_wallet, deposit
 
 
 @pytest.mark.integration
-def test_freeze_blocks_deposit_then_unfreeze_allows(tmp_path: Path):
-    db_path = tmp_path / "e2e_wallet.db"
-    app = create_app({"TESTING": True, "DATABASE": str(db_path)})
-
-    with app.test_client() as client:
-        wallet_id = create_wallet(client, "DKK")
+def test_freeze_blocks_deposit_then_unfreeze_allows(client):
+    wallet_id = create_wallet(client, "DKK")
 
-        freeze_resp = client.post(f"/api/wallets/{wallet_id}/freeze")
-        assert freeze_resp.status_code == 200
+    freeze_resp = client.post(f"/api/wallets/{wallet_id}/freeze")
+    assert freeze_resp.status_code == 200
 
-        deposit_blocked = deposit(client, wallet_id, "1.00", "DKK")
-        assert deposit_blocked.status_code == 422
-        blocked_body = deposit_blocked.get_json()
-        assert blocked_body["transaction"]["error_code"] == "INVALID_WALLET_STATE"
+    deposit_blocked = deposit(client, wallet_id, "1.00", "DKK")
+    assert deposit_blocked.status_code == 422
+    blocked_body = deposit_blocked.get_json()
+    assert blocked_body["transaction"]["error_code"] == "INVALID_WALLET_STATE"
 
-        unfreeze_resp = client.post(f"/api/wallets/{wallet_id}/unfreeze")
-        assert unfreeze_resp.status_code == 200
+    unfreeze_resp = client.post(f"/api/wallets/{wallet_id}/unfreeze")
+    assert unfreeze_resp.status_code == 200
 
-        deposit_ok = deposit(client, wallet_id, "1.00", "DKK")
-        assert deposit_ok.status_code == 200
+    deposit_ok = deposit(client, wallet_id, "1.00", "DKK")
+    assert deposit_ok.status_code == 200
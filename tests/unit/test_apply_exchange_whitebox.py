@@ -21,7 +21,6 @@ Classicist:
 - No mocks needed (pure function)
 - Focus on state changes + transaction outcome
 """
-from datetime import datetime
 from decimal import Decimal
 
 import pytest
@@ -29,20 +28,38 @@ import pytest
 from app.domain.enums import Currency, TransactionErrorCode, TransactionStatus, TransactionType
 from app.domain.rules.apply_exchange import apply_exchange
 
+# Shared Decimal values (parsed once at import).
+ZERO = Decimal("0.00")
+ONE = Decimal("1.0")
+TWO = Decimal("2.0")
+TEN = Decimal("10.00")
+HUNDRED = Decimal("100.00")
 
-def test_apply_exchange_fails_on_self_exchange(wallet_factory):
+
+# Failure paths return the input wallets untouched, so one pair can be shared
+# across the module instead of being rebuilt per test/parametrize case.
+@pytest.fixture(scope="module")
+def dkk_source(wallet_factory):
+    return wallet_factory(wallet_id="source", balance=HUNDRED, currency=Currency.DKK)
+
+
+@pytest.fixture(scope="module")
+def usd_target(wallet_factory):
+    return wallet_factory(wallet_id="target", balance=ZERO, currency=Currency.USD)
+
+
+def test_apply_exchange_fails_on_self_exchange(wallet_factory, get_fixed_timestamp):
     # Arrange: source and target are the same wallet (invalid)
-    now = datetime(2025, 1, 1, 12, 0, 0)
-    wallet = wallet_factory(wallet_id="wallet-1", balance=Decimal("100.00"), currency=Currency.DKK)
+    wallet = wallet_factory(wallet_id="wallet-1", balance=HUNDRED, currency=Currency.DKK)
 
     # Act: attempt exchange into same wallet
     updated_source, updated_target, tx = apply_exchange(
         source_wallet=wallet,
         target_wallet=wallet,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("2.0"),
+        amount=TEN,
+        fx_rate=TWO,
         transaction_id="tx-1",
-        now=now,
+        now=get_fixed_timestamp,
     )
 
     # Assert: wallets unchanged and transaction fails with correct error
@@ -58,20 +75,19 @@ def test_apply_exchange_fails_on_self_exchange(wallet_factory):
     assert tx.target_balance_after is None
 
 
-def test_apply_exchange_fails_on_same_currency(wallet_factory):
+def test_apply_exchange_fails_on_same_currency(wallet_factory, get_fixed_timestamp, dkk_source):
     # Arrange: source and target currencies are the same (unsupported)
-    now = datetime(2025, 1, 1, 12, 0, 0)
-    source = wallet_factory(wallet_id="source", balance=Decimal("100.00"), currency=Currency.DKK)
-    target = wallet_factory(wallet_id="target", balance=Decimal("0.00"), currency=Currency.DKK)
+    source = dkk_source
+    target = wallet_factory(wallet_id="target", balance=ZERO, currency=Currency.DKK)
 
     # Act: attempt exchange between same currencies
     updated_source, updated_target, tx = apply_exchange(
         source_wallet=source,
         target_wallet=target,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("1.0"),
+        amount=TEN,
+        fx_rate=ONE,
         transaction_id="tx-2",
-        now=now,
+        now=get_fixed_timestamp,
     )
 
     # Assert: wallets unchanged and transaction fails with correct error
@@ -82,21 +98,21 @@ def test_apply_exchange_fails_on_same_currency(wallet_factory):
     assert tx.error_code == TransactionErrorCode.UNSUPPORTED_CURRENCY
 
 
-@pytest.mark.parametrize("amount", [Decimal("0"), Decimal("-1")])
-def test_apply_exchange_fails_on_non_positive_amount(wallet_factory, amount: Decimal):
+@pytest.mark.parametrize("amount", [ZERO, Decimal("-1")])
+def test_apply_exchange_fails_on_non_positive_amount(
+    get_fixed_timestamp, dkk_source, usd_target, amount: Decimal
+):
     # Arrange: non-positive amount (invalid)
-    now = datetime(2025, 1, 1, 12, 0, 0)
-    source = wallet_factory(wallet_id="source", balance=Decimal("100.00"), currency=Currency.DKK)
-    target = wallet_factory(wallet_id="target", balance=Decimal("0.00"), currency=Currency.USD)
+    source, target = dkk_source, usd_target
 
     # Act: attempt exchange with invalid amount
     updated_source, updated_target, tx = apply_exchange(
         source_wallet=source,
         target_wallet=target,
         amount=amount,
-        fx_rate=Decimal("2.0"),
+        fx_rate=TWO,
         transaction_id="tx-3",
-        now=now,
+        now=get_fixed_timestamp,
     )
 
     # Assert: wallets unchanged and transaction fails with correct error
@@ -107,20 +123,18 @@ def test_apply_exchange_fails_on_non_positive_amount(wallet_factory, amount: Dec
     assert tx.error_code == TransactionErrorCode.INVALID_AMOUNT
 
 
-def test_apply_exchange_fails_on_missing_fx_rate(wallet_factory):
+def test_apply_exchange_fails_on_missing_fx_rate(get_fixed_timestamp, dkk_source, usd_target):
     # Arrange: FX rate is missing (unavailable)
-    now = datetime(2025, 1, 1, 12, 0, 0)
-    source = wallet_factory(wallet_id="source", balance=Decimal("100.00"), currency=Currency.DKK)
-    target = wallet_factory(wallet_id="target", balance=Decimal("0.00"), currency=Currency.USD)
+    source, target = dkk_source, usd_target
 
     # Act: attempt exchange with an invalid FX rate (e.g., zero)
     updated_source, updated_target, tx = apply_exchange(
         source_wallet=source,
         target_wallet=target,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("0"),
+        amount=TEN,
+        fx_rate=ZERO,
         transaction_id="tx-4",
-        now=now,
+        now=get_fixed_timestamp,
     )
 
     # Assert: wallets unchanged and transaction fails with correct error
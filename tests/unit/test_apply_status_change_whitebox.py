@@ -3,9 +3,11 @@
 These tests validate the explicit branch outcomes of apply_status_change:
 - allowed transitions produce updated wallet + STATUS_CHANGE transaction
 - invalid transitions raise WalletStateError
+(the full from x to status matrix is split into allowed/disallowed pairs)
 """
 
 from decimal import Decimal
+from itertools import product
 
 import pytest
 
@@ -13,6 +15,19 @@ from app.domain.enums import Currency, TransactionStatus, TransactionType, Walle
 from app.domain.exceptions import WalletStateError
 from app.domain.rules.apply_status_change import apply_status_change
 
+# Shared Decimal value (parsed once at import).
+ZERO = Decimal("0.00")
+
+
+@pytest.fixture(scope="module")
+def wallet_in_state(request, wallet_factory):
+    """Wallet in the "from" lifecycle state (indirect param).
+
+    Module-scoped so pytest builds one wallet per distinct from-status and reuses
+    it across cases; apply_status_change never mutates its input wallet.
+    """
+    return wallet_factory(status=request.param)
+
 
 def test_active_to_frozen_creates_status_change_tx(wallet_factory, get_fixed_timestamp):
     # Arrange: ACTIVE wallet (DKK) with any balance
@@ -34,25 +49,39 @@ def test_active_to_frozen_creates_status_change_tx(wallet_factory, get_fixed_tim
     assert tx.status == TransactionStatus.COMPLETED
     assert tx.source_wallet_id == wallet.id
     assert tx.target_wallet_id == wallet.id
-    assert tx.amount == Decimal("0.00")
+    assert tx.amount == ZERO
     assert tx.currency == Currency.DKK
 
 
-@pytest.mark.parametrize(
-    "from_status,to_status",
-    [
-        (WalletStatus.FROZEN, WalletStatus.ACTIVE),
-        (WalletStatus.ACTIVE, WalletStatus.CLOSED),
-        (WalletStatus.FROZEN, WalletStatus.CLOSED),
-    ],
-)
-def test_allowed_transitions_succeed(wallet_factory, get_fixed_timestamp, from_status, to_status):
-    # Arrange: wallet in the "from" lifecycle state
-    wallet = wallet_factory(status=from_status)
+# State diagram: every (from, to) pair not listed here must be rejected.
+ALLOWED_TRANSITIONS = {
+    (WalletStatus.ACTIVE, WalletStatus.FROZEN),
+    (WalletStatus.FROZEN, WalletStatus.ACTIVE),
+    (WalletStatus.ACTIVE, WalletStatus.CLOSED),
+    (WalletStatus.FROZEN, WalletStatus.CLOSED),
+}
+
+
+# (from, to) pairs in enum order so test ids are stable across xdist workers.
+ALLOWED_PAIRS = [
+    pytest.param(src, dst, id=f"{src.value}-{dst.value}")
+    for src, dst in product(WalletStatus, repeat=2)
+    if (src, dst) in ALLOWED_TRANSITIONS
+]
+DISALLOWED_PAIRS = [
+    pytest.param(src, dst, id=f"{src.value}-{dst.value}")
+    for src, dst in product(WalletStatus, repeat=2)
+    if (src, dst) not in ALLOWED_TRANSITIONS
+]
+
+
+@pytest.mark.parametrize("wallet_in_state, to_status", ALLOWED_PAIRS, indirect=["wallet_in_state"])
+def test_allowed_transition_succeeds(wallet_in_state, get_fixed_timestamp, to_status):
+    # Arrange: wallet in the "from" lifecycle state (wallet_in_state)
 
     # Act: apply lifecycle transition
     updated_wallet, tx = apply_status_change(
-        wallet=wallet,
+        wallet=wallet_in_state,
         new_status=to_status,
         transaction_id="tx-2",
         now=get_fixed_timestamp,
@@ -63,24 +92,14 @@ def test_allowed_transitions_succeed(wallet_factory, get_fixed_timestamp, from_s
     assert tx.type == TransactionType.STATUS_CHANGE
 
 
-@pytest.mark.parametrize(
-    "from_status,to_status",
-    [
-        (WalletStatus.CLOSED, WalletStatus.ACTIVE),
-        (WalletStatus.CLOSED, WalletStatus.FROZEN),
-        (WalletStatus.CLOSED, WalletStatus.CLOSED),
-        (WalletStatus.ACTIVE, WalletStatus.ACTIVE),
-        (WalletStatus.FROZEN, WalletStatus.FROZEN),
-    ],
-)
-def test_invalid_transition_raises(wallet_factory, get_fixed_timestamp, from_status, to_status):
-    # Arrange: wallet in the "from" lifecycle state
-    wallet = wallet_factory(status=from_status)
+@pytest.mark.parametrize("wallet_in_state, to_status", DISALLOWED_PAIRS, indirect=["wallet_in_state"])
+def test_disallowed_transition_raises(wallet_in_state, get_fixed_timestamp, to_status):
+    # Arrange: wallet in the "from" lifecycle state (wallet_in_state)
 
     # Act + Assert: invalid transition raises
     with pytest.raises(WalletStateError):
         apply_status_change(
-            wallet=wallet,
+            wallet=wallet_in_state,
             new_status=to_status,
             transaction_id="tx-3",
             now=get_fixed_timestamp,
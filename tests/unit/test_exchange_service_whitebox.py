@@ -38,6 +38,42 @@ from app.domain.exceptions import ExchangeRateServiceError
 from app.services import exchange_service
 
 
+class FakeResponse:
+    """Minimal stand-in for requests.Response (only what exchange_service uses)."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture(scope="session")
+def exchange_app() -> Flask:
+    """Flask app providing EXCHANGE_API_URL to exchange_service (built once)."""
+    app = Flask(__name__)
+    app.config["EXCHANGE_API_URL"] = "https://example.invalid"
+    return app
+
+
+@pytest.fixture
+def stub_requests_get(monkeypatch):
+    """Stub exchange_service.requests.get to return `payload` or raise `exc`."""
+
+    def _stub(payload=None, exc=None):
+        def fake_get(*_args, **_kwargs):
+            if exc is not None:
+                raise exc
+            return FakeResponse(payload)
+
+        monkeypatch.setattr(exchange_service.requests, "get", fake_get)
+
+    return _stub
+
+
 def test_get_exchange_rate_returns_explicit_rate():
     # Arrange: explicit_rate shortcut
     # Act: request rate with explicit override
@@ -60,21 +96,11 @@ def test_get_exchange_rate_same_currency_is_one():
     assert result == Decimal("1.0")
 
 
-def test_get_exchange_rate_success_parses_decimal(monkeypatch):
+def test_get_exchange_rate_success_parses_decimal(exchange_app, stub_requests_get):
     # Arrange: stub external response with numeric rate
-    app = Flask(__name__)
-    app.config["EXCHANGE_API_URL"] = "https://example.invalid"
-
-    class FakeResponse:
-        def raise_for_status(self):
-            return None
+    stub_requests_get(payload={"rates": {"USD": 7.5}})
 
-        def json(self):
-            return {"rates": {"USD": 7.5}}
-
-    monkeypatch.setattr(exchange_service.requests, "get", lambda *args, **kwargs: FakeResponse())
-
-    with app.app_context():
+    with exchange_app.app_context():
         # Act: request rate (uses stubbed requests.get)
         rate = exchange_service.get_exchange_rate(Currency.DKK, Currency.USD)
 
@@ -82,57 +108,22 @@ def test_get_exchange_rate_success_parses_decimal(monkeypatch):
     assert rate == Decimal("7.5")
 
 
-def test_get_exchange_rate_bad_payload_raises(monkeypatch):
-    # Arrange: stub external response with unexpected payload shape
-    app = Flask(__name__)
-    app.config["EXCHANGE_API_URL"] = "https://example.invalid"
-
-    class FakeResponse:
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return {"unexpected": "shape"}
-
-    monkeypatch.setattr(exchange_service.requests, "get", lambda *args, **kwargs: FakeResponse())
-
-    with app.app_context():
-        # Act + Assert: malformed payload is rejected
-        with pytest.raises(ExchangeRateServiceError):
-            exchange_service.get_exchange_rate(Currency.DKK, Currency.USD)
-
-
-def test_get_exchange_rate_non_numeric_rate_raises(monkeypatch):
-    # Arrange: stub external response with non-numeric rate
-    app = Flask(__name__)
-    app.config["EXCHANGE_API_URL"] = "https://example.invalid"
-
-    class FakeResponse:
-        def raise_for_status(self):
-            return None
-
-        def json(self):
-            return {"rates": {"USD": "not-a-number"}}
-
-    monkeypatch.setattr(exchange_service.requests, "get", lambda *args, **kwargs: FakeResponse())
-
-    with app.app_context():
-        # Act + Assert: non-numeric rate is rejected
-        with pytest.raises(ExchangeRateServiceError):
-            exchange_service.get_exchange_rate(Currency.DKK, Currency.USD)
-
-
-def test_get_exchange_rate_requests_error_raises(monkeypatch):
-    # Arrange: requests.get fails
-    app = Flask(__name__)
-    app.config["EXCHANGE_API_URL"] = "https://example.invalid"
-
-    def boom(*_args, **_kwargs):
-        raise requests.RequestException("network down")
-
-    monkeypatch.setattr(exchange_service.requests, "get", boom)
-
-    with app.app_context():
-        # Act + Assert: request error is mapped to ExchangeRateServiceError
+@pytest.mark.parametrize(
+    "payload, exc",
+    [
+        # Malformed payload shape
+        pytest.param({"unexpected": "shape"}, None, id="bad_payload"),
+        # Non-numeric rate (Decimal parsing -> InvalidOperation)
+        pytest.param({"rates": {"USD": "not-a-number"}}, None, id="non_numeric_rate"),
+        # requests.get fails
+        pytest.param(None, requests.RequestException("network down"), id="requests_error"),
+    ],
+)
+def test_get_exchange_rate_failure_raises(exchange_app, stub_requests_get, payload, exc):
+    # Arrange: stub the external call to return a bad payload or raise
+    stub_requests_get(payload=payload, exc=exc)
+
+    with exchange_app.app_context():
+        # Act + Assert: every failure mode is mapped to ExchangeRateServiceError
         with pytest.raises(ExchangeRateServiceError):
             exchange_service.get_exchange_rate(Currency.DKK, Currency.USD)
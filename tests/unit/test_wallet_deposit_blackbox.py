@@ -6,6 +6,8 @@ Unit tests for deposit behaviour, derived from Black-Box Test Design PDF:
 
 Run with pytest:
     python -m pytest tests/unit/test_wallet_deposit_blackbox.py
+Run in parallel (pure functions, no shared state -> safe under pytest-xdist):
+    python -m pytest -n auto tests/unit/test_wallet_deposit_blackbox.py
 Run with coverage:
     python -m pytest --cov=app --cov-report=term-missing tests/unit/test_wallet_deposit_blackbox.py
 """
@@ -21,84 +23,63 @@ from app.domain.enums import (
 )
 from app.domain.rules.apply_deposit import apply_deposit
 
+# Shared Decimal values (parsed once at import).
+TEN = Decimal("10.00")
+HUNDRED = Decimal("100.00")
+
+# Amount partitions as prebuilt pytest.param tables (value + short id).
+VALID_AMOUNTS = (
+    pytest.param(Decimal("0.01"), id="min"),          # lower boundary of valid
+    pytest.param(Decimal("0.02"), id="eps"),
+    pytest.param(Decimal("1000000"), id="1m"),
+    pytest.param(Decimal("1000000.00"), id="1m_00"),  # large value, two-decimal scale
+    pytest.param(Decimal("9999999999"), id="max"),    # large value within valid partition
+)
+INVALID_AMOUNTS = (
+    pytest.param(Decimal("-9999999999"), id="neg_max"),  # extreme negative EP
+    pytest.param(Decimal("-1000000"), id="neg_1m"),      # large negative
+    pytest.param(Decimal("-0.02"), id="neg_eps"),        # just below boundary -0.01
+    pytest.param(Decimal("-0.01"), id="neg_min"),        # boundary to zero
+    pytest.param(Decimal("0.00"), id="zero"),            # boundary between invalid and valid
+)
+
 
 # ------------------------------------------------
 # Positive testing (EP + 3-V BVA)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("amount", [
-    Decimal("0.01"),        # lower boundary of valid
-    Decimal("0.02"),
-    Decimal("1000000"),     
-    Decimal("9999999999"),  # large value within valid partition
-])
-def test_deposit_valid_amount_passes(wallet_factory, get_fixed_timestamp, amount: Decimal):
+@pytest.mark.parametrize("amount", VALID_AMOUNTS)
+def test_deposit_valid_amount(active_dkk_wallet, get_fixed_timestamp, amount: Decimal):
     # Arrange: ACTIVE wallet with a known starting balance
-    initial_balance = Decimal("100.00")
-    wallet = wallet_factory(
-        balance=initial_balance,
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
+    initial_balance = active_dkk_wallet.balance
 
     # Act: deposit a valid amount in the wallet currency
-    _, transaction = apply_deposit(
-        wallet=wallet,
+    updated_wallet, transaction = apply_deposit(
+        wallet=active_dkk_wallet,
         amount=amount,
         currency=Currency.DKK,
         transaction_id="tx-valid-amount",
         now=get_fixed_timestamp,
     )
 
-    # Assert: transaction succeeds without an error code
-    expected = (
-        TransactionStatus.COMPLETED,
-        None,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-@pytest.mark.parametrize("amount", [
-    Decimal("0.01"),        # lower boundary of valid
-    Decimal("0.02"),
-    Decimal("1000000"),     
-    Decimal("9999999999"),  # large value within valid partition
-])
-def test_deposit_adds_correctly_to_balance(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet with a known starting balance
-    initial_balance = Decimal("50.00")
-    wallet = wallet_factory(
-        balance=initial_balance,
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: deposit the amount
-    updated_wallet,_ = apply_deposit(
-        wallet=wallet,
-        amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-correct-balance",
-        now=get_fixed_timestamp,
-    )
+    # Assert: transaction succeeds and balance is increased by the deposited amount
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
+    assert updated_wallet.balance == initial_balance + amount
 
-    # Assert: balance is increased by the deposited amount
-    expected_balance = initial_balance + amount
-    assert updated_wallet.balance == expected_balance
+    # Assert (data type): decimals remain Decimal (no float conversion)
+    assert type(updated_wallet.balance) is Decimal
+    assert type(transaction.amount) is Decimal
 
 
 @pytest.mark.parametrize("currency", [
     Currency.DKK,
     Currency.EUR,
     Currency.USD,
-])
+], ids=["dkk", "eur", "usd"])
 def test_deposit_supported_currencies_pass(wallet_factory, get_fixed_timestamp, currency):
     # Arrange: ACTIVE wallet with a supported currency
-    initial_balance = Decimal("100.00")
+    initial_balance = HUNDRED
     wallet = wallet_factory(
         balance=initial_balance,
         currency=currency,
@@ -108,227 +89,107 @@ def test_deposit_supported_currencies_pass(wallet_factory, get_fixed_timestamp,
     # Act: deposit a valid amount in the same currency
     updated_wallet, transaction = apply_deposit(
         wallet=wallet,
-        amount=Decimal("10.00"),  # any valid amount from amount EP
+        amount=TEN,  # any valid amount from amount EP
         currency=currency,
         transaction_id=f"tx-{currency.value.lower()}-deposit",
         now=get_fixed_timestamp,
     )
 
     # Assert: wallet balance increases and transaction succeeds
-    expected = (
-        initial_balance + Decimal("10.00"),
-        TransactionStatus.COMPLETED,
-        None,
-    )
-    actual = (
-        updated_wallet.balance,
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
+    assert updated_wallet.balance == initial_balance + TEN
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
 
 
 # ------------------------------------------------
 # Negative testing (EP + 3-V BVA)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("amount", [
-    Decimal("-9999999999"), # extreme negative EP
-    Decimal("-1000000"),    # large negative
-    Decimal("-0.02"),       # just below boundary -0.01
-    Decimal("-0.01"),       # boundary to zero
-    Decimal("0.00"),        # boundary between invalid and valid
-])
-def test_deposit_invalid_amount_fails(wallet_factory, get_fixed_timestamp, amount: Decimal):
+@pytest.mark.parametrize("amount", INVALID_AMOUNTS)
+def test_deposit_invalid_amount(active_dkk_wallet, get_fixed_timestamp, amount: Decimal):
     # Arrange: ACTIVE wallet and an invalid (non-positive) deposit amount
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
+    initial_balance = active_dkk_wallet.balance
 
     # Act: attempt the deposit
-    _, transaction = apply_deposit(
-        wallet=wallet,
+    updated_wallet, transaction = apply_deposit(
+        wallet=active_dkk_wallet,
         amount=amount,
         currency=Currency.DKK,
         transaction_id="tx-invalid-amount",
         now=get_fixed_timestamp,
     )
 
-    # Assert: transaction fails with INVALID_AMOUNT
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.INVALID_AMOUNT,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-@pytest.mark.parametrize("amount", [
-    Decimal("-9999999999"), # extreme negative EP
-    Decimal("-1000000"),    # large negative
-    Decimal("-0.02"),       # just below boundary -0.01
-    Decimal("-0.01"),       # boundary to zero
-    Decimal("0.00"),        # boundary between invalid and valid
-])
-def test_deposit_negative_amount_keeps_balance(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet with a known starting balance
-    initial_balance = Decimal("100")
-    wallet = wallet_factory(
-        balance=initial_balance,
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: attempt an invalid deposit
-    updated_wallet, _ = apply_deposit(
-        wallet=wallet,
-        amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-balance-unchanged",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: wallet balance is unchanged on failed deposit
+    # Assert: transaction fails with INVALID_AMOUNT and balance is unchanged
+    assert transaction.status is TransactionStatus.FAILED
+    assert transaction.error_code is TransactionErrorCode.INVALID_AMOUNT
     assert updated_wallet.balance == initial_balance
 
 
 # ------------------------------------------------
-# Negative testing (Decision Table Wallet Status)
+# Negative testing (Decision Table: wallet status, currency, amount)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("status", [
-    WalletStatus.FROZEN,
-    WalletStatus.CLOSED,
-])
-def test_deposit_on_non_active_wallet_fails(wallet_factory, get_fixed_timestamp, status: WalletStatus):
-    # Arrange: wallet is not ACTIVE (deposit should be blocked)
+# One row per failing rule: (wallet status, deposit currency, amount, expected error).
+DEPOSIT_FAILURE_TABLE = [
+    pytest.param(WalletStatus.FROZEN, Currency.DKK, TEN, TransactionErrorCode.INVALID_WALLET_STATE, id="frozen"),
+    pytest.param(WalletStatus.CLOSED, Currency.DKK, TEN, TransactionErrorCode.INVALID_WALLET_STATE, id="closed"),
+    # supported currencies that do not match the DKK wallet
+    pytest.param(WalletStatus.ACTIVE, Currency.EUR, TEN, TransactionErrorCode.UNSUPPORTED_CURRENCY, id="eur"),
+    pytest.param(WalletStatus.ACTIVE, Currency.USD, TEN, TransactionErrorCode.UNSUPPORTED_CURRENCY, id="usd"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("-0.01"), TransactionErrorCode.INVALID_AMOUNT, id="neg_amount"),
+]
+
+
+@pytest.mark.parametrize("status, deposit_currency, amount, error_code", DEPOSIT_FAILURE_TABLE)
+def test_deposit_failure_decision_table(
+    wallet_factory, get_fixed_timestamp, status, deposit_currency, amount, error_code
+):
+    # Arrange: DKK wallet in the row's status
     wallet = wallet_factory(
-        balance=Decimal("100.00"),
+        balance=HUNDRED,
         currency=Currency.DKK,
         status=status,
     )
 
-    # Act: attempt deposit into non-active wallet
-    _, transaction = apply_deposit(
-        wallet=wallet,
-        amount=Decimal("10.00"),
-        currency=Currency.DKK,
-        transaction_id="tx-non-active-wallet",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with INVALID_WALLET_STATE
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.INVALID_WALLET_STATE,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-# ------------------------------------------------
-# Negative testing: currency mismatch (Currency EP + decision rule)
-# ------------------------------------------------
-
-@pytest.mark.parametrize("deposit_currency", [
-    Currency.EUR,   # supported but does not match wallet DKK
-    Currency.USD,   # supported but does not match wallet DKK
-])
-def test_deposit_currency_mismatch_fails(wallet_factory, get_fixed_timestamp, deposit_currency):
-    # Arrange: ACTIVE DKK wallet but deposit currency differs (unsupported)
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: attempt deposit with mismatching currency
-    _, transaction = apply_deposit(
-        wallet=wallet,
-        amount=Decimal("10.00"),
-        currency=deposit_currency,
-        transaction_id="tx-currency-mismatch",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with UNSUPPORTED_CURRENCY
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.UNSUPPORTED_CURRENCY,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-# ------------------------------------------------
-# Data type testing
-# ------------------------------------------------
-
-@pytest.mark.parametrize("amount", [
-    Decimal("0.01"),
-    Decimal("0.02"),
-    Decimal("1000000.00"),
-])
-def test_deposit_returns_decimal_balance_and_amount(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet and a valid deposit amount
-    initial_balance = Decimal("100.00")
-    wallet = wallet_factory(
-        balance=initial_balance,
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: deposit and capture returned wallet/transaction objects
+    # Act: attempt the deposit
     updated_wallet, transaction = apply_deposit(
         wallet=wallet,
         amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-datatype",
+        currency=deposit_currency,
+        transaction_id="tx-decision-table",
         now=get_fixed_timestamp,
     )
 
-    # Assert: decimals remain Decimal (no float conversion)
-    expected = (Decimal, Decimal)
-    actual = (type(updated_wallet.balance), type(transaction.amount))
-    assert actual == expected
+    # Assert: transaction fails with the rule's error code and balance is unchanged
+    assert transaction.status is TransactionStatus.FAILED
+    assert transaction.error_code is error_code
+    assert updated_wallet.balance == HUNDRED
 
 
 # ------------------------------------------------
 # Error testing (wrong data type for amount)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("amount", [
+# Wrong-typed amounts: each must raise TypeError.
+BAD_TYPE_AMOUNTS = (
     "10",      # string instead of Decimal
     "10.00",   # string instead of Decimal
     "abc",     # non-numeric string
     None,      # NoneType
     "",        # empty string
-])
-def test_deposit_invalid_amount_type_raises_typeerror(wallet_factory, get_fixed_timestamp, amount):
-    # Arrange: ACTIVE wallet but amount is the wrong type
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
+)
+
 
-    # Act + Assert: rule enforces Decimal typing
-    with pytest.raises(TypeError):
-        apply_deposit(
-            wallet=wallet,
-            amount=amount,
-            currency=Currency.DKK,
-            transaction_id="tx-wrong-type",
-            now=get_fixed_timestamp,
-        )
+def test_deposit_invalid_amount_type_raises_typeerror(active_dkk_wallet, get_fixed_timestamp, subtests):
+    # Arrange: shared ACTIVE DKK wallet but amount is the wrong type
+    for amount in BAD_TYPE_AMOUNTS:
+        # Act + Assert: rule enforces Decimal typing (one subtest per value)
+        with subtests.test(amount=amount):
+            with pytest.raises(TypeError):
+                apply_deposit(
+                    wallet=active_dkk_wallet,
+                    amount=amount,
+                    currency=Currency.DKK,
+                    transaction_id="tx-wrong-type",
+                    now=get_fixed_timestamp,
+                )
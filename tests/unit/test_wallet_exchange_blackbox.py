@@ -5,10 +5,13 @@ Unit tests for exchange behaviour, derived from Black-Box Test Design PDF:
 
 Run with pytest:
     python -m pytest tests/unit/test_wallet_exchange_blackbox.py
+Run for fast local iteration (no cache writes; coverage is off unless --cov is passed):
+    python -m pytest -p no:cacheprovider tests/unit/test_wallet_exchange_blackbox.py
 Run with coverage:
     python -m pytest --cov=app --cov-report=term-missing tests/unit/test_wallet_exchange_blackbox.py
 """
 from decimal import Decimal
+from itertools import permutations
 
 import pytest
 
@@ -20,27 +23,56 @@ from app.domain.enums import (
 )
 from app.domain.rules.apply_exchange import apply_exchange
 
+# Shared Decimal values (parsed once at import).
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+ONE = Decimal("1.0")
+TEN = Decimal("10.00")
+FIFTY = Decimal("50.00")
+NINETY = Decimal("90.00")
+HUNDRED = Decimal("100.00")
+LARGE_BALANCE = Decimal("100000000000")  # covers every valid amount below
+
+# Every ordered pair of distinct supported currencies (grows with the Currency enum).
+CURRENCY_PAIRS = [
+    pytest.param(pair, id=f"{pair[0].value.lower()}-{pair[1].value.lower()}")
+    for pair in permutations(Currency, 2)
+]
+
+
+@pytest.fixture(scope="module")
+def wallet_pair(request, wallet_factory):
+    """ACTIVE (source, target) wallets for a (source_currency, target_currency) indirect param.
+
+    Source holds 100.00, target 0.00. Module-scoped: Wallet is frozen, so each
+    currency pair is built once and shared by every test that requests it.
+    """
+    source_currency, target_currency = request.param
+    source = wallet_factory(balance=HUNDRED, currency=source_currency, status=WalletStatus.ACTIVE)
+    target = wallet_factory(balance=ZERO, currency=target_currency, status=WalletStatus.ACTIVE)
+    return source, target
+
 
 # ------------------------------------------------
 # Positive testing (EP + 3-V BVA)
 # ------------------------------------------------
 
 @pytest.mark.parametrize("amount, fx_rate, expected_target_credit", [
-    (Decimal("0.01"), Decimal("1.0"), Decimal("0.01")),     # lower boundary of valid amount
-    (Decimal("0.02"), Decimal("1.0"), Decimal("0.02")),     # just above lower boundary
-    (Decimal("10.00"), Decimal("0.01"), Decimal("0.10")),   # lower boundary of valid fx_rate
+    (CENT, ONE, CENT),                                      # lower boundary of valid amount
+    (Decimal("0.02"), ONE, Decimal("0.02")),                # just above lower boundary
+    (TEN, CENT, Decimal("0.10")),                           # lower boundary of valid fx_rate
     (Decimal("1000000"), Decimal("1.5"), Decimal("1500000")), # typical valid large value
     (Decimal("9999999999"), Decimal("0.5"), Decimal("4999999999.5")), # large value within valid partition
-])
+], ids=["amt_min", "amt_eps", "rate_min", "amt_1m", "amt_max"])
 def test_exchange_valid_amount_passes(wallet_factory, get_fixed_timestamp, amount, fx_rate, expected_target_credit):
     # Arrange: ACTIVE source/target wallets with different currencies
     source_wallet = wallet_factory(
-        balance=Decimal("100000000000"),
+        balance=LARGE_BALANCE,
         currency=Currency.EUR,
         status=WalletStatus.ACTIVE,
     )
     target_wallet = wallet_factory(
-        balance=Decimal("0.00"),
+        balance=ZERO,
         currency=Currency.USD,
         status=WalletStatus.ACTIVE,
     )
@@ -56,24 +88,16 @@ def test_exchange_valid_amount_passes(wallet_factory, get_fixed_timestamp, amoun
     )
 
     # Assert: transaction completes and credited amount matches expectation
-    expected = (
-        TransactionStatus.COMPLETED,
-        None,
-        expected_target_credit,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-        transaction.credited_amount,
-    )
-    assert actual == expected
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
+    assert transaction.credited_amount == expected_target_credit
 
 
 @pytest.mark.parametrize("initial_source, initial_target, amount, fx_rate, expected_source, expected_target", [
-    (Decimal("100.00"), Decimal("50.00"), Decimal("99.99"), Decimal("1.0"), Decimal("0.01"), Decimal("149.99")), # Boundary: just below balance
-    (Decimal("100.00"), Decimal("50.00"), Decimal("100.00"), Decimal("1.0"), Decimal("0.00"), Decimal("150.00")), # Boundary: exact balance
-    (Decimal("0.01"), Decimal("0.00"), Decimal("0.01"), Decimal("1.0"), Decimal("0.00"), Decimal("0.01")), # Boundary: exact balance (small)
-])
+    (HUNDRED, FIFTY, Decimal("99.99"), ONE, CENT, Decimal("149.99")),  # Boundary: just below balance
+    (HUNDRED, FIFTY, HUNDRED, ONE, ZERO, Decimal("150.00")),           # Boundary: exact balance
+    (CENT, ZERO, CENT, ONE, ZERO, CENT),                               # Boundary: exact balance (small)
+], ids=["below_balance", "exact_balance", "exact_balance_small"])
 def test_exchange_updates_balances_correctly(wallet_factory, get_fixed_timestamp, initial_source, initial_target, amount, fx_rate, expected_source, expected_target):
     # Arrange: wallets with known balances for a balance-update check
     source_wallet = wallet_factory(
@@ -99,48 +123,26 @@ def test_exchange_updates_balances_correctly(wallet_factory, get_fixed_timestamp
     assert (updated_source.balance, updated_target.balance) == (expected_source, expected_target)
 
 
-@pytest.mark.parametrize("source_currency, target_currency", [
-    (Currency.DKK, Currency.EUR),
-    (Currency.USD, Currency.DKK),
-    (Currency.EUR, Currency.USD),
-])
-def test_exchange_supported_currency_pairs_pass(wallet_factory, get_fixed_timestamp, source_currency, target_currency):
+@pytest.mark.parametrize("wallet_pair", CURRENCY_PAIRS, indirect=True)
+def test_exchange_supported_currency_pairs_pass(wallet_pair, get_fixed_timestamp):
     # Arrange: ACTIVE wallets using a supported currency pair
-    source_wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=source_currency,
-        status=WalletStatus.ACTIVE,
-    )
-    target_wallet = wallet_factory(
-        balance=Decimal("0.00"),
-        currency=target_currency,
-        status=WalletStatus.ACTIVE,
-    )
+    source_wallet, target_wallet = wallet_pair
 
     # Act: exchange a fixed valid amount
     updated_source, updated_target, transaction = apply_exchange(
         source_wallet=source_wallet,
         target_wallet=target_wallet,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("1.0"),
+        amount=TEN,
+        fx_rate=ONE,
         transaction_id="tx-currency-pair",
         now=get_fixed_timestamp,
     )
 
     # Assert: balances and transaction outcome match expectations
-    expected = (
-        Decimal("90.00"),
-        Decimal("10.00"),
-        TransactionStatus.COMPLETED,
-        None,
-    )
-    actual = (
-        updated_source.balance,
-        updated_target.balance,
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
+    assert updated_source.balance == NINETY
+    assert updated_target.balance == TEN
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
 
 
 # ------------------------------------------------
@@ -152,76 +154,52 @@ def test_exchange_supported_currency_pairs_pass(wallet_factory, get_fixed_timest
     Decimal("-1000000"),    # large negative
     Decimal("-0.02"),       # just below boundary -0.01
     Decimal("-0.01"),       # boundary to zero
-    Decimal("0.00"),        # boundary between invalid and valid
-])
+    ZERO,                   # boundary between invalid and valid
+], ids=["neg_max", "neg_1m", "neg_eps", "neg_min", "zero"])
 def test_exchange_invalid_amount_fails(wallet_factory, get_fixed_timestamp, amount):
-    # Arrange: valid wallets but an invalid (non-positive) amount
-    source = wallet_factory(balance=Decimal("100.00"), currency=Currency.EUR)
-    target = wallet_factory(balance=Decimal("0.00"), currency=Currency.USD)
-
-    # Act: attempt exchange
-    _, _, transaction = apply_exchange(
-        source_wallet=source,
-        target_wallet=target,
-        amount=amount,
-        fx_rate=Decimal("1.0"),
-        transaction_id="tx-invalid-amount",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with INVALID_AMOUNT
-    assert transaction.error_code == TransactionErrorCode.INVALID_AMOUNT
-
-
-@pytest.mark.parametrize("amount", [
-    Decimal("-9999999999"), # extreme negative EP
-    Decimal("-1000000"),    # large negative
-    Decimal("-0.02"),       # just below boundary -0.01
-    Decimal("-0.01"),       # boundary to zero
-    Decimal("0.00"),        # boundary between invalid and valid
-])
-def test_exchange_failure_keeps_both_balances_unchanged(wallet_factory, get_fixed_timestamp, amount):
-    # Arrange: wallets with known starting balances
-    initial_source = Decimal("100.00")
-    initial_target = Decimal("50.00")
+    # Arrange: valid wallets with known balances but an invalid (non-positive) amount
+    initial_source = HUNDRED
+    initial_target = FIFTY
     source = wallet_factory(balance=initial_source, currency=Currency.EUR)
     target = wallet_factory(balance=initial_target, currency=Currency.USD)
 
-    # Act: attempt exchange with invalid amount
-    updated_source, updated_target, _ = apply_exchange(
+    # Act: attempt exchange
+    updated_source, updated_target, transaction = apply_exchange(
         source_wallet=source,
         target_wallet=target,
         amount=amount,
-        fx_rate=Decimal("1.0"),
-        transaction_id="tx-balance-unchanged",
+        fx_rate=ONE,
+        transaction_id="tx-invalid-amount",
         now=get_fixed_timestamp,
     )
 
-    # Assert: balances remain unchanged when exchange fails
-    assert (updated_source.balance, updated_target.balance) == (initial_source, initial_target)
+    # Assert: transaction fails with INVALID_AMOUNT and both balances are unchanged
+    assert updated_source.balance == initial_source
+    assert updated_target.balance == initial_target
+    assert transaction.error_code is TransactionErrorCode.INVALID_AMOUNT
 
 
+@pytest.mark.parametrize("wallet_pair", [(Currency.EUR, Currency.USD)], indirect=True, ids=["eur-usd"])
 @pytest.mark.parametrize("amount", [
     Decimal("100.01"),  # Just above balance
     Decimal("1000.00"), # Way above
-])
-def test_exchange_insufficient_funds_fails(wallet_factory, get_fixed_timestamp, amount):
+], ids=["just_above", "way_above"])
+def test_exchange_insufficient_funds_fails(wallet_pair, get_fixed_timestamp, amount):
     # Arrange: source wallet does not have enough funds for the requested amount
-    source = wallet_factory(balance=Decimal("100.00"), currency=Currency.EUR)
-    target = wallet_factory(balance=Decimal("0.00"), currency=Currency.USD)
+    source, target = wallet_pair
 
     # Act: attempt exchange
     _, _, transaction = apply_exchange(
         source_wallet=source,
         target_wallet=target,
         amount=amount,
-        fx_rate=Decimal("1.0"),
+        fx_rate=ONE,
         transaction_id="tx-insufficient",
         now=get_fixed_timestamp,
     )
 
     # Assert: transaction fails with INSUFFICIENT_FUNDS
-    assert transaction.error_code == TransactionErrorCode.INSUFFICIENT_FUNDS
+    assert transaction.error_code is TransactionErrorCode.INSUFFICIENT_FUNDS
 
 
 @pytest.mark.parametrize("source_status, target_status", [
@@ -229,86 +207,97 @@ def test_exchange_insufficient_funds_fails(wallet_factory, get_fixed_timestamp,
     (WalletStatus.CLOSED, WalletStatus.ACTIVE),
     (WalletStatus.ACTIVE, WalletStatus.FROZEN),
     (WalletStatus.ACTIVE, WalletStatus.CLOSED),
-])
+], ids=["frozen-active", "closed-active", "active-frozen", "active-closed"])
 def test_exchange_with_non_active_wallets_fails(wallet_factory, get_fixed_timestamp, source_status, target_status):
     # Arrange: one or both wallets are not ACTIVE (exchange should be blocked)
-    source = wallet_factory(status=source_status, currency=Currency.EUR, balance=Decimal("100.00"))
+    source = wallet_factory(status=source_status, currency=Currency.EUR, balance=HUNDRED)
     target = wallet_factory(status=target_status, currency=Currency.USD)
 
     # Act: attempt exchange
     _, _, transaction = apply_exchange(
         source_wallet=source,
         target_wallet=target,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("1.0"),
+        amount=TEN,
+        fx_rate=ONE,
         transaction_id="tx-status-fail",
         now=get_fixed_timestamp,
     )
 
     # Assert: transaction fails with INVALID_WALLET_STATE
-    assert transaction.error_code == TransactionErrorCode.INVALID_WALLET_STATE
+    assert transaction.error_code is TransactionErrorCode.INVALID_WALLET_STATE
 
 
-def test_exchange_same_currency_fails(wallet_factory, get_fixed_timestamp):
+@pytest.mark.parametrize("wallet_pair", [(Currency.EUR, Currency.EUR)], indirect=True, ids=["eur-eur"])
+def test_exchange_same_currency_fails(wallet_pair, get_fixed_timestamp):
     # Arrange: source and target wallets use the same currency (unsupported)
-    source = wallet_factory(currency=Currency.EUR, balance=Decimal("100.00"))
-    target = wallet_factory(currency=Currency.EUR) # Same currency
+    source, target = wallet_pair
 
     # Act: attempt exchange
     _, _, transaction = apply_exchange(
         source_wallet=source,
         target_wallet=target,
-        amount=Decimal("10.00"),
-        fx_rate=Decimal("1.0"),
+        amount=TEN,
+        fx_rate=ONE,
         transaction_id="tx-same-currency",
         now=get_fixed_timestamp,
     )
 
     # Assert: transaction fails with UNSUPPORTED_CURRENCY
-    assert transaction.error_code == TransactionErrorCode.UNSUPPORTED_CURRENCY
+    assert transaction.error_code is TransactionErrorCode.UNSUPPORTED_CURRENCY
 
 
+@pytest.mark.parametrize("wallet_pair", [(Currency.EUR, Currency.USD)], indirect=True, ids=["eur-usd"])
 @pytest.mark.parametrize("fx_rate", [
     None,
-    Decimal("0.00"),        # Boundary: Zero (Invalid)
+    ZERO,                   # Boundary: Zero (Invalid)
     Decimal("-0.01"),       # Boundary: Just below zero (Invalid)
     Decimal("-1.5"),        # Negative EP
-])
-def test_exchange_invalid_fx_rate_fails(wallet_factory, get_fixed_timestamp, fx_rate):
+], ids=["none", "zero", "neg_min", "negative"])
+def test_exchange_invalid_fx_rate_fails(wallet_pair, get_fixed_timestamp, fx_rate):
     # Arrange: FX rate is missing/invalid (unavailable)
-    source = wallet_factory(currency=Currency.EUR, balance=Decimal("100.00"))
-    target = wallet_factory(currency=Currency.USD)
+    source, target = wallet_pair
 
     # Act: attempt exchange
     _, _, transaction = apply_exchange(
         source_wallet=source,
         target_wallet=target,
-        amount=Decimal("10.00"),
+        amount=TEN,
         fx_rate=fx_rate,
         transaction_id="tx-bad-rate",
         now=get_fixed_timestamp,
     )
 
     # Assert: transaction fails with EXCHANGE_RATE_UNAVAILABLE
-    assert transaction.error_code == TransactionErrorCode.EXCHANGE_RATE_UNAVAILABLE
+    assert transaction.error_code is TransactionErrorCode.EXCHANGE_RATE_UNAVAILABLE
 
 
 # ------------------------------------------------
 # Data type testing
 # ------------------------------------------------
 
-def test_exchange_invalid_amount_type_raises_typeerror(wallet_factory, get_fixed_timestamp):
+# Wrong-typed amounts: each must raise TypeError.
+BAD_TYPE_AMOUNTS = (
+    "10.00",   # string instead of Decimal
+    "abc",     # non-numeric string
+    None,      # NoneType
+    "",        # empty string
+)
+
+
+@pytest.mark.parametrize("wallet_pair", [(Currency.EUR, Currency.USD)], indirect=True, ids=["eur-usd"])
+def test_exchange_invalid_amount_type_raises_typeerror(wallet_pair, get_fixed_timestamp, subtests):
     # Arrange: wallets are valid but amount is the wrong type
-    source = wallet_factory(currency=Currency.EUR, balance=Decimal("100.00"))
-    target = wallet_factory(currency=Currency.USD)
-
-    # Act + Assert: rule enforces Decimal typing
-    with pytest.raises(TypeError):
-        apply_exchange(
-            source_wallet=source,
-            target_wallet=target,
-            amount="10.00", # String
-            fx_rate=Decimal("1.0"),
-            transaction_id="tx-type-error",
-            now=get_fixed_timestamp,
-        )
+    source, target = wallet_pair
+
+    for amount in BAD_TYPE_AMOUNTS:
+        # Act + Assert: rule enforces Decimal typing (one subtest per value)
+        with subtests.test(amount=amount):
+            with pytest.raises(TypeError):
+                apply_exchange(
+                    source_wallet=source,
+                    target_wallet=target,
+                    amount=amount,
+                    fx_rate=ONE,
+                    transaction_id="tx-type-error",
+                    now=get_fixed_timestamp,
+                )
@@ -31,11 +31,14 @@ Hybrid:
 How to read each test
 ---------------------
 Arrange: stub repo + rule functions to force a specific branch/path
+         (the autouse `service_stubs` fixture already captures persistence
+         and fixes uuid4; tests only override the seams they care about)
 Act: call exactly one service function
 Assert: verify returned objects / exceptions and captured persisted objects
 """
 from datetime import datetime, timezone
 from decimal import Decimal
+from types import SimpleNamespace
 from uuid import UUID
 
 import pytest
@@ -47,45 +50,125 @@ from app.domain.models.Wallet import Wallet
 from app.services import wallet_service
 
 
-def test_create_wallet_persists_via_repo(monkeypatch):
-    # Arrange: deterministic id and capture persistence intent
-    fixed_uuid = UUID("00000000-0000-0000-0000-000000000001")
-    monkeypatch.setattr(wallet_service, "uuid4", lambda: fixed_uuid)
-
+# Shared Decimal values (parsed once at import).
+ZERO = Decimal("0.00")
+TWO = Decimal("2.0")
+FIVE = Decimal("5.00")
+TEN = Decimal("10.00")
+TWENTY = Decimal("20.00")
+NINETY = Decimal("90.00")
+HUNDRED = Decimal("100.00")
+
+FIXED_UUID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+def fixed_uuid4() -> UUID:
+    """Stand-in for wallet_service.uuid4 (shared; no per-test closure)."""
+    return FIXED_UUID
+
+
+# Rule outputs returned by the apply_* stubs (read-only in every test).
+NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+TX_DEPOSIT = Transaction.deposit(
+    transaction_id="tx-deposit",
+    wallet_id="w1",
+    amount=TEN,
+    currency=Currency.DKK,
+    status=TransactionStatus.COMPLETED,
+    error_code=None,
+    created_at=NOW,
+    target_balance_after=TEN,
+)
+TX_WITHDRAW = Transaction.withdrawal(
+    transaction_id="tx-withdraw",
+    wallet_id="w1",
+    amount=FIVE,
+    currency=Currency.DKK,
+    status=TransactionStatus.COMPLETED,
+    error_code=None,
+    created_at=NOW,
+    source_balance_after=FIVE,
+)
+TX_EXCHANGE = Transaction.exchange(
+    transaction_id="tx-exchange",
+    source_wallet_id="source",
+    target_wallet_id="target",
+    amount=TEN,
+    source_currency=Currency.DKK,
+    credited_amount=TWENTY,
+    credited_currency=Currency.USD,
+    source_balance_after=NINETY,
+    target_balance_after=TWENTY,
+    status=TransactionStatus.COMPLETED,
+    error_code=None,
+    created_at=NOW,
+)
+
+
+@pytest.fixture(autouse=True)
+def service_stubs(monkeypatch):
+    """Patch wallet_service's uuid/persistence seams with capture stubs.
+
+    Every test gets a fixed uuid4 and capture-only persistence (no DB writes).
+    Returns a namespace with:
+    - persisted: last wallet/transaction written, plus all wallets in order
+    - set(**seams): override any wallet_service seams for this test in one call
+      (like mock.patch.multiple, but undone by monkeypatch)
+    """
     persisted: dict[str, object] = {"wallet": None, "transaction": None, "wallets": []}
 
-    def persist_created_wallet(created_wallet: Wallet) -> None:
-        persisted["wallet"] = created_wallet
+    def persist_wallet(w: Wallet) -> None:
+        persisted["wallet"] = w
+        persisted["wallets"].append(w)
+
+    def persist_transaction(t: Transaction) -> None:
+        persisted["transaction"] = t
+
+    defaults = {
+        "uuid4": fixed_uuid4,
+        "repo_create_wallet": persist_wallet,
+        "update_wallet": persist_wallet,
+        "create_transaction": persist_transaction,
+    }
+
+    def set_seams(**seams) -> None:
+        for name, value in seams.items():
+            monkeypatch.setattr(wallet_service, name, value)
+
+    set_seams(**defaults)
+    return SimpleNamespace(persisted=persisted, set=set_seams)
 
-    monkeypatch.setattr(wallet_service, "repo_create_wallet", persist_created_wallet)
+
+def test_create_wallet_persists_via_repo(service_stubs):
+    # Arrange: deterministic id and persistence capture come from service_stubs
 
     # Act: create wallet
     wallet = wallet_service.create_wallet(Currency.DKK, initial_balance=Decimal("12.34"))
 
     # Assert: returned wallet has expected invariants
-    assert wallet.id == str(fixed_uuid)
+    assert wallet.id == str(FIXED_UUID)
     assert wallet.currency == Currency.DKK
     assert wallet.balance == Decimal("12.34")
     assert wallet.created_at is not None
     assert wallet.updated_at == wallet.created_at
 
     # Assert (persistence intent): created wallet was persisted
-    assert persisted["wallet"] == wallet
+    assert service_stubs.persisted["wallet"] == wallet
 
 
-def test_get_wallet_raises_when_missing(monkeypatch):
+def test_get_wallet_raises_when_missing(service_stubs):
     # Arrange: missing wallet in repository
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: None)
+    service_stubs.set(repo_get_wallet=lambda _wallet_id: None)
 
     # Act + Assert: service raises service-level error
     with pytest.raises(WalletNotFoundError):
         wallet_service.get_wallet("missing-wallet")
 
 
-def test_list_wallets_returns_repo_results(monkeypatch, wallet_factory):
+def test_list_wallets_returns_repo_results(service_stubs, wallet_factory):
     # Arrange: repo returns wallets
     wallets = [wallet_factory(wallet_id="w1"), wallet_factory(wallet_id="w2")]
-    monkeypatch.setattr(wallet_service, "repo_get_all_wallets", lambda: wallets)
+    service_stubs.set(repo_get_all_wallets=lambda: wallets)
 
     # Act: list wallets
     result = wallet_service.list_wallets()
@@ -94,192 +177,85 @@ def test_list_wallets_returns_repo_results(monkeypatch, wallet_factory):
     assert result == wallets
 
 
-def test_deposit_money_persists_wallet_and_transaction(monkeypatch, wallet_factory):
-    # Arrange: wallet exists and rule returns an updated wallet + transaction
-    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    fixed_uuid = UUID("00000000-0000-0000-0000-000000000002")
-
-    wallet = wallet_factory(wallet_id="w1", balance=Decimal("0.00"), currency=Currency.DKK)
-    updated_wallet = wallet_factory(wallet_id="w1", balance=Decimal("10.00"), currency=Currency.DKK)
-    tx = Transaction.deposit(
-        transaction_id="tx-deposit",
-        wallet_id="w1",
-        amount=Decimal("10.00"),
-        currency=Currency.DKK,
-        status=TransactionStatus.COMPLETED,
-        error_code=None,
-        created_at=now,
-        target_balance_after=Decimal("10.00"),
-    )
-
-    monkeypatch.setattr(wallet_service, "uuid4", lambda: fixed_uuid)
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: wallet)
-
-    monkeypatch.setattr(wallet_service, "apply_deposit", lambda **_kwargs: (updated_wallet, tx))
-
-    persisted: dict[str, object] = {"wallet": None, "transaction": None, "wallets": []}
-
-    def persist_wallet(w: Wallet) -> None:
-        persisted["wallet"] = w
-
-    def persist_transaction(t: Transaction) -> None:
-        persisted["transaction"] = t
+# (service function, rule seam, starting balance, amount, balance after, rule transaction)
+SINGLE_WALLET_OPERATIONS = (
+    pytest.param("deposit_money", "apply_deposit", ZERO, TEN, TEN, TX_DEPOSIT, id="deposit"),
+    pytest.param("withdraw_money", "apply_withdraw", TEN, FIVE, FIVE, TX_WITHDRAW, id="withdraw"),
+)
 
-    monkeypatch.setattr(wallet_service, "update_wallet", persist_wallet)
-    monkeypatch.setattr(wallet_service, "create_transaction", persist_transaction)
 
-    # Act: deposit money
-    returned_wallet, returned_tx = wallet_service.deposit_money(
-        wallet_id="w1",
-        amount=Decimal("10.00"),
-        currency=Currency.DKK,
-        now=now,
-    )
-
-    # Assert: service returns rule outputs
-    assert returned_wallet == updated_wallet
-    assert returned_tx == tx
-
-    # Assert (persistence intent): updated wallet + transaction were persisted
-    assert persisted["wallet"] == updated_wallet
-    assert persisted["transaction"] == tx
-
-
-def test_withdraw_money_persists_wallet_and_transaction(monkeypatch, wallet_factory):
+@pytest.mark.parametrize(
+    "service_fn, rule_seam, balance, amount, balance_after, rule_tx", SINGLE_WALLET_OPERATIONS
+)
+def test_single_wallet_operation_persists_wallet_and_transaction(
+    service_stubs, wallet_factory, service_fn, rule_seam, balance, amount, balance_after, rule_tx
+):
     # Arrange: wallet exists and rule returns an updated wallet + transaction
-    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    fixed_uuid = UUID("00000000-0000-0000-0000-000000000003")
+    wallet = wallet_factory(wallet_id="w1", balance=balance, currency=Currency.DKK)
+    updated_wallet = wallet_factory(wallet_id="w1", balance=balance_after, currency=Currency.DKK)
 
-    wallet = wallet_factory(wallet_id="w1", balance=Decimal("10.00"), currency=Currency.DKK)
-    updated_wallet = wallet_factory(wallet_id="w1", balance=Decimal("5.00"), currency=Currency.DKK)
-    tx = Transaction.withdrawal(
-        transaction_id="tx-withdraw",
-        wallet_id="w1",
-        amount=Decimal("5.00"),
-        currency=Currency.DKK,
-        status=TransactionStatus.COMPLETED,
-        error_code=None,
-        created_at=now,
-        source_balance_after=Decimal("5.00"),
+    service_stubs.set(
+        repo_get_wallet=lambda _wallet_id: wallet,
+        **{rule_seam: lambda **_kwargs: (updated_wallet, rule_tx)},
     )
 
-    monkeypatch.setattr(wallet_service, "uuid4", lambda: fixed_uuid)
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: wallet)
-
-    monkeypatch.setattr(wallet_service, "apply_withdraw", lambda **_kwargs: (updated_wallet, tx))
-
-    persisted: dict[str, object] = {"wallet": None, "transaction": None, "wallets": []}
-
-    def persist_wallet(w: Wallet) -> None:
-        persisted["wallet"] = w
-
-    def persist_transaction(t: Transaction) -> None:
-        persisted["transaction"] = t
-
-    monkeypatch.setattr(wallet_service, "update_wallet", persist_wallet)
-    monkeypatch.setattr(wallet_service, "create_transaction", persist_transaction)
-
-    # Act: withdraw money
-    returned_wallet, returned_tx = wallet_service.withdraw_money(
+    # Act: deposit or withdraw money
+    returned_wallet, returned_tx = getattr(wallet_service, service_fn)(
         wallet_id="w1",
-        amount=Decimal("5.00"),
+        amount=amount,
         currency=Currency.DKK,
-        now=now,
+        now=NOW,
     )
 
     # Assert: service returns rule outputs
-    assert returned_wallet == updated_wallet
-    assert returned_tx == tx
+    assert returned_wallet is updated_wallet
+    assert returned_tx is rule_tx
 
     # Assert (persistence intent): updated wallet + transaction were persisted
-    assert persisted["wallet"] == updated_wallet
-    assert persisted["transaction"] == tx
+    assert service_stubs.persisted["wallet"] is updated_wallet
+    assert service_stubs.persisted["transaction"] is rule_tx
 
 
-def test_exchange_money_calls_fx_then_persists(monkeypatch, wallet_factory):
+def test_exchange_money_calls_fx_then_persists(service_stubs, wallet_factory):
     # Arrange: two wallets exist and rule returns updated wallets + transaction
-    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    fixed_uuid = UUID("00000000-0000-0000-0000-000000000004")
-
-    source = wallet_factory(wallet_id="source", balance=Decimal("100.00"), currency=Currency.DKK)
-    target = wallet_factory(wallet_id="target", balance=Decimal("0.00"), currency=Currency.USD)
+    source = wallet_factory(wallet_id="source", balance=HUNDRED, currency=Currency.DKK)
+    target = wallet_factory(wallet_id="target", balance=ZERO, currency=Currency.USD)
 
-    updated_source = wallet_factory(wallet_id="source", balance=Decimal("90.00"), currency=Currency.DKK)
-    updated_target = wallet_factory(wallet_id="target", balance=Decimal("20.00"), currency=Currency.USD)
-
-    tx = Transaction.exchange(
-        transaction_id="tx-exchange",
-        source_wallet_id="source",
-        target_wallet_id="target",
-        amount=Decimal("10.00"),
-        source_currency=Currency.DKK,
-        credited_amount=Decimal("20.00"),
-        credited_currency=Currency.USD,
-        source_balance_after=Decimal("90.00"),
-        target_balance_after=Decimal("20.00"),
-        status=TransactionStatus.COMPLETED,
-        error_code=None,
-        created_at=now,
-    )
-
-    monkeypatch.setattr(wallet_service, "uuid4", lambda: fixed_uuid)
+    updated_source = wallet_factory(wallet_id="source", balance=NINETY, currency=Currency.DKK)
+    updated_target = wallet_factory(wallet_id="target", balance=TWENTY, currency=Currency.USD)
 
     def fake_repo_get_wallet(wallet_id: str):
         return {"source": source, "target": target}.get(wallet_id)
 
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", fake_repo_get_wallet)
-
-    monkeypatch.setattr(wallet_service, "get_exchange_rate", lambda _src, _dst: Decimal("2.0"))
-    monkeypatch.setattr(wallet_service, "apply_exchange", lambda **_kwargs: (updated_source, updated_target, tx))
-
-    persisted: dict[str, object] = {"wallet": None, "transaction": None, "wallets": []}
-
-    def persist_wallet(w: Wallet) -> None:
-        persisted["wallets"].append(w)
-
-    def persist_transaction(t: Transaction) -> None:
-        persisted["transaction"] = t
-
-    monkeypatch.setattr(wallet_service, "update_wallet", persist_wallet)
-    monkeypatch.setattr(wallet_service, "create_transaction", persist_transaction)
+    service_stubs.set(
+        repo_get_wallet=fake_repo_get_wallet,
+        get_exchange_rate=lambda _src, _dst: TWO,
+        apply_exchange=lambda **_kwargs: (updated_source, updated_target, TX_EXCHANGE),
+    )
 
     # Act: exchange money
     returned_source, returned_target, returned_tx = wallet_service.exchange_money(
         source_wallet_id="source",
         target_wallet_id="target",
-        amount=Decimal("10.00"),
-        now=now,
+        amount=TEN,
+        now=NOW,
     )
 
     # Assert: service returns rule outputs
-    assert returned_source == updated_source
-    assert returned_target == updated_target
-    assert returned_tx == tx
+    assert returned_source is updated_source
+    assert returned_target is updated_target
+    assert returned_tx is TX_EXCHANGE
 
     # Assert (persistence intent): both wallets + transaction were persisted
-    assert persisted["wallets"] == [updated_source, updated_target]
+    assert service_stubs.persisted["wallets"] == [updated_source, updated_target]
 
 
 def test_change_wallet_status_persists_wallet_and_status_change_transaction(
-    monkeypatch, wallet_factory
+    service_stubs, wallet_factory
 ):
-    # Arrange: deterministic tx id + repo wallet
-    fixed_uuid = UUID("00000000-0000-0000-0000-000000000005")
-    monkeypatch.setattr(wallet_service, "uuid4", lambda: fixed_uuid)
-
+    # Arrange: repo wallet (deterministic tx id comes from service_stubs)
     wallet = wallet_factory(wallet_id="w-status")
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: wallet)
-
-    persisted: dict[str, object] = {"wallet": None, "transaction": None}
-
-    def persist_wallet(w: Wallet) -> None:
-        persisted["wallet"] = w
-
-    def persist_transaction(t: Transaction) -> None:
-        persisted["transaction"] = t
-
-    monkeypatch.setattr(wallet_service, "update_wallet", persist_wallet)
-    monkeypatch.setattr(wallet_service, "create_transaction", persist_transaction)
+    service_stubs.set(repo_get_wallet=lambda _wallet_id: wallet)
 
     # Act: freeze the wallet via the service entrypoint
     updated_wallet, tx = wallet_service.change_wallet_status(
@@ -294,21 +270,20 @@ def test_change_wallet_status_persists_wallet_and_status_change_transaction(
     assert tx.type == TransactionType.STATUS_CHANGE
 
     # Assert: persistence intent
-    assert persisted["wallet"] == updated_wallet
-    assert persisted["transaction"] == tx
+    assert service_stubs.persisted["wallet"] is updated_wallet
+    assert service_stubs.persisted["transaction"] is tx
 
 
 def test_change_wallet_status_invalid_transition_raises_and_does_not_persist(
-    monkeypatch, wallet_factory
+    service_stubs, wallet_factory
 ):
     # Arrange: ACTIVE -> ACTIVE is not allowed by the domain rule
     wallet = wallet_factory(status=WalletStatus.ACTIVE)
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: wallet)
 
     def fail_if_persist(_w: Wallet) -> None:
         raise AssertionError("Should not persist wallet on invalid transition")
 
-    monkeypatch.setattr(wallet_service, "update_wallet", fail_if_persist)
+    service_stubs.set(repo_get_wallet=lambda _wallet_id: wallet, update_wallet=fail_if_persist)
 
     # Act + Assert: invalid transition is rejected and nothing is persisted
     with pytest.raises(WalletStateError):
@@ -319,22 +294,24 @@ def test_change_wallet_status_invalid_transition_raises_and_does_not_persist(
         )
 
 
-def test_list_transactions_raises_when_wallet_missing(monkeypatch):
+def test_list_transactions_raises_when_wallet_missing(service_stubs):
     # Arrange: missing wallet in repository
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: None)
+    service_stubs.set(repo_get_wallet=lambda _wallet_id: None)
 
     # Act + Assert: service raises service-level error
     with pytest.raises(WalletNotFoundError):
         wallet_service.list_transactions("missing")
 
 
-def test_list_transactions_returns_repo_results_when_wallet_exists(monkeypatch, wallet_factory):
+def test_list_transactions_returns_repo_results_when_wallet_exists(service_stubs, wallet_factory):
     # Arrange: wallet exists and repo returns transactions
     wallet = wallet_factory(wallet_id="w1")
     expected = [object(), object()]
 
-    monkeypatch.setattr(wallet_service, "repo_get_wallet", lambda _wallet_id: wallet)
-    monkeypatch.setattr(wallet_service, "repo_get_transactions", lambda _wallet_id: expected)
+    service_stubs.set(
+        repo_get_wallet=lambda _wallet_id: wallet,
+        repo_get_transactions=lambda _wallet_id: expected,
+    )
 
     # Act: list transactions
     result = wallet_service.list_transactions("w1")
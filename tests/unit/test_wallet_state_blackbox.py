@@ -4,6 +4,8 @@ Unit tests for wallet state transitions, derived from Black-Box Test Design PDF:
 
 Run with pytest:
     python -m pytest tests/unit/test_wallet_state_blackbox.py
+Run in parallel (pure functions, no shared state -> safe under pytest-xdist):
+    python -m pytest -n auto tests/unit/test_wallet_state_blackbox.py
 Run with coverage:
     python -m pytest --cov=app --cov-report=term-missing tests/unit/test_wallet_state_blackbox.py
 """
@@ -20,51 +22,41 @@ from app.domain.rules.wallet_state import (
 
 
 # ------------------------------------------------
-# Positive testing (Valid Transitions)
+# State transition table: valid transitions, ignored invalid transitions
+# out of CLOSED, and idempotent no-op transitions.
 # ------------------------------------------------
 
-def test_transition_active_to_frozen(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts ACTIVE
-    wallet = wallet_factory(status=WalletStatus.ACTIVE)
-
-    # Act: freeze wallet
-    updated_wallet = freeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: wallet becomes FROZEN
-    assert updated_wallet.status == WalletStatus.FROZEN
-
-
-def test_transition_frozen_to_active(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts FROZEN
-    wallet = wallet_factory(status=WalletStatus.FROZEN)
-
-    # Act: unfreeze wallet
-    updated_wallet = unfreeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: wallet becomes ACTIVE
-    assert updated_wallet.status == WalletStatus.ACTIVE
-
-
-def test_transition_active_to_closed(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts ACTIVE
-    wallet = wallet_factory(status=WalletStatus.ACTIVE)
-
-    # Act: close wallet
-    updated_wallet = close_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: wallet becomes CLOSED
-    assert updated_wallet.status == WalletStatus.CLOSED
-
-
-def test_transition_frozen_to_closed(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts FROZEN
-    wallet = wallet_factory(status=WalletStatus.FROZEN)
+# (initial status, action, expected status)
+TRANSITIONS = [
+    # Positive testing (valid transitions)
+    (WalletStatus.ACTIVE, freeze_wallet, WalletStatus.FROZEN),
+    (WalletStatus.FROZEN, unfreeze_wallet, WalletStatus.ACTIVE),
+    (WalletStatus.ACTIVE, close_wallet, WalletStatus.CLOSED),
+    (WalletStatus.FROZEN, close_wallet, WalletStatus.CLOSED),
+    # Negative testing (CLOSED is terminal: transition ignored)
+    (WalletStatus.CLOSED, unfreeze_wallet, WalletStatus.CLOSED),
+    (WalletStatus.CLOSED, freeze_wallet, WalletStatus.CLOSED),
+    # Idempotency / no-op transitions
+    (WalletStatus.FROZEN, freeze_wallet, WalletStatus.FROZEN),
+    (WalletStatus.ACTIVE, unfreeze_wallet, WalletStatus.ACTIVE),
+    (WalletStatus.CLOSED, close_wallet, WalletStatus.CLOSED),
+]
+
+
+@pytest.mark.parametrize(
+    "initial, action, expected",
+    TRANSITIONS,
+    ids=[f"{initial.name}-{action.__name__}" for initial, action, _ in TRANSITIONS],
+)
+def test_state_transition(wallet_factory, get_fixed_timestamp, initial, action, expected):
+    # Arrange: wallet starts in the row's initial status
+    wallet = wallet_factory(status=initial)
 
-    # Act: close wallet
-    updated_wallet = close_wallet(wallet, now=get_fixed_timestamp)
+    # Act: apply the row's transition
+    updated_wallet = action(wallet, now=get_fixed_timestamp)
 
-    # Assert: wallet becomes CLOSED
-    assert updated_wallet.status == WalletStatus.CLOSED
+    # Assert: wallet ends in the expected status
+    assert updated_wallet.status is expected
 
 
 def test_transition_preserves_data_integrity(wallet_factory, get_fixed_timestamp):
@@ -87,68 +79,3 @@ def test_transition_preserves_data_integrity(wallet_factory, get_fixed_timestamp
     assert updated_wallet.balance == wallet.balance
     assert updated_wallet.currency == wallet.currency
     assert updated_wallet.created_at == wallet.created_at
-
-
-# ------------------------------------------------
-# Negative testing (Invalid Transitions)
-# ------------------------------------------------
-
-def test_transition_closed_to_active_fails(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts CLOSED (terminal)
-    wallet = wallet_factory(status=WalletStatus.CLOSED)
-
-    # Act: attempt invalid transition CLOSED -> ACTIVE
-    updated_wallet = unfreeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: should remain CLOSED (transition ignored)
-    # Should remain CLOSED (transition ignored)
-    assert updated_wallet.status == WalletStatus.CLOSED
-
-
-def test_transition_closed_to_frozen_fails(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet starts CLOSED (terminal)
-    wallet = wallet_factory(status=WalletStatus.CLOSED)
-
-    # Act: attempt invalid transition CLOSED -> FROZEN
-    updated_wallet = freeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: should remain CLOSED (transition ignored)
-    # Should remain CLOSED (transition ignored)
-    assert updated_wallet.status == WalletStatus.CLOSED
-
-
-# ------------------------------------------------
-# Idempotency / No-op Transitions
-# ------------------------------------------------
-
-def test_freeze_on_already_frozen_wallet(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet is already FROZEN
-    wallet = wallet_factory(status=WalletStatus.FROZEN)
-
-    # Act: freeze again (idempotent)
-    updated_wallet = freeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: remains FROZEN
-    assert updated_wallet.status == WalletStatus.FROZEN
-
-
-def test_unfreeze_on_already_active_wallet(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet is already ACTIVE
-    wallet = wallet_factory(status=WalletStatus.ACTIVE)
-
-    # Act: unfreeze again (no-op)
-    updated_wallet = unfreeze_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: remains ACTIVE
-    assert updated_wallet.status == WalletStatus.ACTIVE
-
-
-def test_close_on_already_closed_wallet(wallet_factory, get_fixed_timestamp):
-    # Arrange: wallet is already CLOSED
-    wallet = wallet_factory(status=WalletStatus.CLOSED)
-
-    # Act: close again (idempotent)
-    updated_wallet = close_wallet(wallet, now=get_fixed_timestamp)
-
-    # Assert: remains CLOSED
-    assert updated_wallet.status == WalletStatus.CLOSED
@@ -6,6 +6,8 @@ Unit tests for withdraw behaviour, derived from Black-Box Test Design PDF:
 
 Run with pytest:
     python -m pytest tests/unit/test_wallet_withdraw_blackbox.py
+Run in parallel (pure functions, no shared state -> safe under pytest-xdist):
+    python -m pytest -n auto tests/unit/test_wallet_withdraw_blackbox.py
 Run with coverage:
     python -m pytest --cov=app --cov-report=term-missing tests/unit/test_wallet_withdraw_blackbox.py
 """
@@ -21,17 +23,26 @@ from app.domain.enums import (
 )
 from app.domain.rules.apply_withdraw import apply_withdraw
 
+# Shared Decimal values (parsed once at import).
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+TEN = Decimal("10.00")
+HUNDRED = Decimal("100.00")
+
+# Valid amount partition as a prebuilt pytest.param table (value + short id).
+VALID_AMOUNTS = (
+    pytest.param(CENT, id="min"),                   # lower boundary of valid
+    pytest.param(Decimal("0.02"), id="eps"),        # just above lower boundary
+    pytest.param(Decimal("1000000"), id="1m"),      # typical valid value
+    pytest.param(Decimal("9999999999"), id="max"),  # large value within valid partition
+)
+
 
 # ------------------------------------------------
 # Positive testing (EP + 3-V BVA)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("amount", [
-    Decimal("0.01"),        # lower boundary of valid
-    Decimal("0.02"),        # just above lower boundary
-    Decimal("1000000"),     # typical valid value
-    Decimal("9999999999"),  # large value within valid partition
-])
+@pytest.mark.parametrize("amount", VALID_AMOUNTS)
 def test_withdraw_valid_amount_passes(wallet_factory, get_fixed_timestamp, amount: Decimal):
     # Arrange: ACTIVE wallet with sufficient funds
     initial_balance = Decimal("100000000000")
@@ -51,21 +62,14 @@ def test_withdraw_valid_amount_passes(wallet_factory, get_fixed_timestamp, amoun
     )
 
     # Assert: transaction succeeds without an error code
-    expected = (
-        TransactionStatus.COMPLETED,
-        None,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
 
 
 @pytest.mark.parametrize("initial_balance, amount, expected_remaining", [
-    (Decimal("100.00"), Decimal("99.99"), Decimal("0.01")),  # Boundary: just below balance (valid)
-    (Decimal("100.00"), Decimal("100.00"), Decimal("0.00")), # Boundary: exact balance (valid)
-    (Decimal("0.01"), Decimal("0.01"), Decimal("0.00")),     # Boundary: exact balance (small)
+    (HUNDRED, Decimal("99.99"), CENT),  # Boundary: just below balance (valid)
+    (HUNDRED, HUNDRED, ZERO),           # Boundary: exact balance (valid)
+    (CENT, CENT, ZERO),                 # Boundary: exact balance (small)
 ])
 def test_withdraw_deducts_correctly_from_balance(wallet_factory, get_fixed_timestamp, initial_balance, amount, expected_remaining):
     # Arrange: ACTIVE wallet with known balance and a valid withdraw amount
@@ -95,7 +99,7 @@ def test_withdraw_deducts_correctly_from_balance(wallet_factory, get_fixed_times
 ])
 def test_withdraw_supported_currencies_pass(wallet_factory, get_fixed_timestamp, currency):
     # Arrange: ACTIVE wallet with a supported currency
-    initial_balance = Decimal("100.00")
+    initial_balance = HUNDRED
     wallet = wallet_factory(
         balance=initial_balance,
         currency=currency,
@@ -105,192 +109,66 @@ def test_withdraw_supported_currencies_pass(wallet_factory, get_fixed_timestamp,
     # Act: withdraw a valid amount in the same currency
     updated_wallet, transaction = apply_withdraw(
         wallet=wallet,
-        amount=Decimal("10.00"),
+        amount=TEN,
         currency=currency,
         transaction_id=f"tx-{currency.value.lower()}-withdraw",
         now=get_fixed_timestamp,
     )
 
     # Assert: wallet balance decreases and transaction succeeds
-    expected = (
-        initial_balance - Decimal("10.00"),
-        TransactionStatus.COMPLETED,
-        None,
-    )
-    actual = (
-        updated_wallet.balance,
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
+    assert updated_wallet.balance == initial_balance - TEN
+    assert transaction.status is TransactionStatus.COMPLETED
+    assert transaction.error_code is None
 
 
 # ------------------------------------------------
-# Negative testing (EP + 3-V BVA)
+# Negative testing (EP + 3-V BVA + Decision Table)
 # ------------------------------------------------
 
-@pytest.mark.parametrize("amount", [
-    Decimal("-9999999999"), # extreme negative EP
-    Decimal("-10.00"),      # negative
-    Decimal("-0.02"),       # just below boundary -0.01
-    Decimal("-0.01"),       # boundary negative
-    Decimal("0.00"),        # boundary invalid
-])
-def test_withdraw_invalid_amount_fails(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet and an invalid (non-positive) withdraw amount
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: attempt the withdrawal
-    _, transaction = apply_withdraw(
-        wallet=wallet,
-        amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-invalid-amount",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with INVALID_AMOUNT
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.INVALID_AMOUNT,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-@pytest.mark.parametrize("amount", [
-    Decimal("-9999999999"), # extreme negative EP
-    Decimal("-10.00"),      # negative
-    Decimal("-0.02"),       # just below boundary -0.01
-    Decimal("-0.01"),       # boundary negative
-    Decimal("0.00"),        # boundary invalid
-])
-def test_withdraw_negative_amount_keeps_balance(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet with known starting balance
-    initial_balance = Decimal("100.00")
-    wallet = wallet_factory(
-        balance=initial_balance,
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: attempt an invalid withdrawal
-    updated_wallet, _ = apply_withdraw(
-        wallet=wallet,
-        amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-balance-unchanged",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: balance stays unchanged on failed withdrawal
-    assert updated_wallet.balance == initial_balance
-
-
-@pytest.mark.parametrize("amount", [
-    Decimal("100.01"),      # Just above balance (Boundary)
-    Decimal("1000.00"),     # Way above balance
-])
-def test_withdraw_insufficient_funds_fails(wallet_factory, get_fixed_timestamp, amount: Decimal):
-    # Arrange: ACTIVE wallet where amount exceeds available balance
+# One row per failing rule: (wallet status, withdraw currency, amount, expected error).
+WITHDRAW_FAILURE_TABLE = [
+    # non-positive amounts (EP + 3-V BVA)
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("-9999999999"), TransactionErrorCode.INVALID_AMOUNT, id="neg_max"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("-10.00"), TransactionErrorCode.INVALID_AMOUNT, id="neg_10"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("-0.02"), TransactionErrorCode.INVALID_AMOUNT, id="neg_eps"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("-0.01"), TransactionErrorCode.INVALID_AMOUNT, id="neg_min"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, ZERO, TransactionErrorCode.INVALID_AMOUNT, id="zero"),
+    # amounts above the 100.00 balance
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("100.01"), TransactionErrorCode.INSUFFICIENT_FUNDS, id="just_above_balance"),
+    pytest.param(WalletStatus.ACTIVE, Currency.DKK, Decimal("1000.00"), TransactionErrorCode.INSUFFICIENT_FUNDS, id="way_above_balance"),
+    # wallet not ACTIVE
+    pytest.param(WalletStatus.FROZEN, Currency.DKK, TEN, TransactionErrorCode.INVALID_WALLET_STATE, id="frozen"),
+    pytest.param(WalletStatus.CLOSED, Currency.DKK, TEN, TransactionErrorCode.INVALID_WALLET_STATE, id="closed"),
+    # supported currencies that do not match the DKK wallet
+    pytest.param(WalletStatus.ACTIVE, Currency.EUR, TEN, TransactionErrorCode.UNSUPPORTED_CURRENCY, id="eur"),
+    pytest.param(WalletStatus.ACTIVE, Currency.USD, TEN, TransactionErrorCode.UNSUPPORTED_CURRENCY, id="usd"),
+]
+
+
+@pytest.mark.parametrize("status, withdraw_currency, amount, error_code", WITHDRAW_FAILURE_TABLE)
+def test_withdraw_failure_decision_table(
+    wallet_factory, get_fixed_timestamp, status, withdraw_currency, amount, error_code
+):
+    # Arrange: DKK wallet (balance 100.00) in the row's status
     wallet = wallet_factory(
-        balance=Decimal("100.00"),
+        balance=HUNDRED,
         currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
+        status=status,
     )
 
     # Act: attempt the withdrawal
-    _, transaction = apply_withdraw(
+    updated_wallet, transaction = apply_withdraw(
         wallet=wallet,
         amount=amount,
-        currency=Currency.DKK,
-        transaction_id="tx-insufficient",
+        currency=withdraw_currency,
+        transaction_id="tx-decision-table",
         now=get_fixed_timestamp,
     )
 
-    # Assert: transaction fails with INSUFFICIENT_FUNDS
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.INSUFFICIENT_FUNDS,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-@pytest.mark.parametrize("status", [
-    WalletStatus.FROZEN,
-    WalletStatus.CLOSED,
-])
-def test_withdraw_on_non_active_wallet_fails(wallet_factory, get_fixed_timestamp, status: WalletStatus):
-    # Arrange: wallet is not ACTIVE (withdraw should be blocked)
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=status,
-    )
-
-    # Act: attempt withdraw from non-active wallet
-    _, transaction = apply_withdraw(
-        wallet=wallet,
-        amount=Decimal("10.00"),
-        currency=Currency.DKK,
-        transaction_id="tx-status-fail",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with INVALID_WALLET_STATE
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.INVALID_WALLET_STATE,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
-
-
-@pytest.mark.parametrize("withdraw_currency", [
-    Currency.EUR,
-    Currency.USD,
-])
-def test_withdraw_currency_mismatch_fails(wallet_factory, get_fixed_timestamp, withdraw_currency):
-    # Arrange: ACTIVE DKK wallet but withdraw currency differs (unsupported)
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
-
-    # Act: attempt withdraw with mismatching currency
-    _, transaction = apply_withdraw(
-        wallet=wallet,
-        amount=Decimal("10.00"),
-        currency=withdraw_currency, # Mismatch
-        transaction_id="tx-currency-fail",
-        now=get_fixed_timestamp,
-    )
-
-    # Assert: transaction fails with UNSUPPORTED_CURRENCY
-    expected = (
-        TransactionStatus.FAILED,
-        TransactionErrorCode.UNSUPPORTED_CURRENCY,
-    )
-    actual = (
-        transaction.status,
-        transaction.error_code,
-    )
-    assert actual == expected
+    # Assert: transaction fails with the rule's error code and balance is unchanged
+    assert transaction.status is TransactionStatus.FAILED
+    assert transaction.error_code is error_code
+    assert updated_wallet.balance == HUNDRED
 
 
 # ------------------------------------------------
@@ -298,7 +176,7 @@ def test_withdraw_currency_mismatch_fails(wallet_factory, get_fixed_timestamp, w
 # ------------------------------------------------
 
 @pytest.mark.parametrize("amount", [
-    Decimal("0.01"),
+    CENT,
     Decimal("0.02"),
     Decimal("1000000.00"),
 ])
@@ -321,9 +199,8 @@ def test_withdraw_returns_decimal_balance_and_amount(wallet_factory, get_fixed_t
     )
 
     # Assert: decimals remain Decimal (no float conversion)
-    expected = (Decimal, Decimal)
-    actual = (type(updated_wallet.balance), type(transaction.amount))
-    assert actual == expected
+    assert type(updated_wallet.balance) is Decimal
+    assert type(transaction.amount) is Decimal
 
 
 @pytest.mark.parametrize("amount", [
@@ -331,18 +208,13 @@ def test_withdraw_returns_decimal_balance_and_amount(wallet_factory, get_fixed_t
     10.0,      # float instead of Decimal
     None,      # NoneType
 ])
-def test_withdraw_invalid_amount_type_raises_typeerror(wallet_factory, get_fixed_timestamp, amount):
-    # Arrange: ACTIVE wallet but amount is the wrong type
-    wallet = wallet_factory(
-        balance=Decimal("100.00"),
-        currency=Currency.DKK,
-        status=WalletStatus.ACTIVE,
-    )
+def test_withdraw_invalid_amount_type_raises_typeerror(active_dkk_wallet, get_fixed_timestamp, amount):
+    # Arrange: shared ACTIVE DKK wallet but amount is the wrong type
 
     # Act + Assert: rule enforces Decimal typing
     with pytest.raises(TypeError):
         apply_withdraw(
-            wallet=wallet,
+            wallet=active_dkk_wallet,
             amount=amount,
             currency=Currency.DKK,
             transaction_id="tx-wrong-type",